@@ -7,15 +7,27 @@ Copyright (C) <2025-2028>  <darkathena@qq.com>
 """
 
 import os
+import atexit
 import re
 import sys
 import json
 import time
+import functools
+import gzip
+import asyncio
+import types
+import tempfile
+import sqlite3
+import string
+import threading
 import click
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin, urlparse, unquote
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 from markdownify import markdownify as md
 import logging
 
@@ -28,32 +40,890 @@ try:
     from selenium.webdriver.chrome.options import Options as ChromeOptions
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
     from webdriver_manager.microsoft import EdgeChromiumDriverManager
     from webdriver_manager.chrome import ChromeDriverManager
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# 尝试导入 Playwright（Selenium 不可用时的备选渲染引擎）
+try:
+    from playwright.async_api import async_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 预编译的正则表达式（提取流程中的热点路径）
+_SCRIPT_RE = re.compile(r'<script[^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+# 匹配 self.__next_f.push( 并定位到其后的 [1,"..."] 参数起始位置
+_PUSH_RE = re.compile(r'self\.__next_f\.push\((?=\[1,")')
+_PUSH_ARGS_PREFIX = '[1,"'
+_JSON_DECODER = json.JSONDecoder()
+# 单次扫描匹配所有转义序列：\uXXXX 或反斜杠加任意单个字符
+_ESCAPE_RE = re.compile(r'\\(?:u([0-9a-fA-F]{4})|(.))', re.DOTALL)
+# 导航数据：一次扫描匹配 "routes"/"paths"/"links"/"pages"/"navigation"/"sidebar"/"menuItems" 数组
+_NAV_DATA_RE = re.compile(
+    r'"(?P<key>routes?|paths?|links?|pages|navigation|sidebar|menuItems)":\s*\[(?P<items>[^\]]+)\]',
+    re.IGNORECASE | re.DOTALL
+)
+# 导航数据键的前置过滤：脚本中不含这些子串时无需运行正则（_NAV_DATA_RE 忽略大小写，因此用小写形式在小写化的脚本中查找）
+_NAV_KEYS = ('"route', '"path', '"link', '"pages"', '"navigation"', '"sidebar"', '"menuitems"')
+# 原始文件名路由模式依赖的字段名，用于在正则匹配前快速预筛（路由模式忽略大小写，需在小写化的内容中查找）
+_ROUTE_KEYS = ('"pathname"', '"href"', '"slug"', '"route"')
+_NAV_FILENAME_OBJECT_RE = re.compile(
+    r'\{[^}]*(?:"title":\s*"([^"]+)")[^}]*(?:"(?:href|path|route)":\s*"[^"]*\/([0-9]+(?:\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*)"[^}]*|[^}]*"(?:href|path|route)":\s*"[^"]*\/([0-9]+(?:\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*)"[^}]*"title":\s*"([^"]+)")[^}]*\}',
+    re.IGNORECASE
+)
+_TITLE_RE = re.compile(r'"title":\s*"([^"]+)"')
+_ORDER_RE = re.compile(r'"order":\s*(\d+)')
+_LEVEL_RE = re.compile(r'"level":\s*(\d+)')
+# 一级标题行（"# " 后紧跟的不是 "#"），捕获标题文本
+_H1_RE = re.compile(r'^[^\S\n]*# (?!#)[^\S\n]*(\S[^\n]*)', re.MULTILINE)
+_HEADING_RE = re.compile(r'# ([^#\n]+)')
+# 匹配 Sources 行中的链接格式：[filename:line1-line2]() 或 [filename:line1]()
+_SOURCES_RE = re.compile(r'Sources:\s*(.+?)(?=\n|$)', re.MULTILINE)
+_LINK_RE = re.compile(r'\[([^:]+):(\d+)(?:-(\d+))?\]\(\)')
+
+# 序号文件名（如 "1-overview", "4.1-backend-api-reference"）
+_FILENAME_RE = re.compile(r'^[0-9]+(\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*$')
+_LOOSE_FILENAME_RE = re.compile(r'^[0-9]+.*-[a-zA-Z]')
+_BROAD_FILENAME_RE = re.compile(r'\b[0-9]+[-\.][a-zA-Z][a-zA-Z0-9-]*\b')
+_ROUTE_CANDIDATE_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9-_.]*$')
+# 标题与 slug
+_LEADING_NUM_RE = re.compile(r'^(\d+)')
+_TITLE_NUM_RE = re.compile(r'^(\d+)[\.\s-]*(.+)')
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[\s_-]+')
+_WS_RE = re.compile(r'\s+')
+# _extract_page_info 依次尝试的标题来源：(soup 方法, 查询)
+_TITLE_CANDIDATE_QUERIES = (
+    ('find', 'title'),
+    ('find', 'h1'),
+    ('find', 'h2'),
+    ('select_one', '[data-testid="page-title"]'),
+    ('select_one', '.page-title'),
+    ('select_one', '.title'),
+)
+# 解析时保留的标题标签名和类名（与上面的查询对应）
+_PAGE_TITLE_TAGS = frozenset(('title', 'h1', 'h2'))
+_TITLE_CLASSES = frozenset(('page-title', 'title'))
+# 合并内容中明显属于数据（而非正文）的行前缀
+_DATA_LINE_PREFIXES = ('{"', '["')
+
+# 原始文件名：标准序号文件名模式（如 "1-overview", "4.1-backend-api-reference"），从最具体到最宽泛排列
+_STANDARD_FILENAME_PATTERNS = (
+    # 匹配 "1-overview", "2-getting-started" 等模式
+    r'"([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)"',
+    r"'([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)'",
+    # 匹配 "1.1-system-architecture", "4.1-backend-api-reference" 等模式
+    r'"([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)"',
+    r"'([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)'",
+    # 匹配路径中的文件名（结尾分隔符只做前瞻，不吞掉后面可能作为引号模式开头的字符）
+    r'\/([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)(?=\/|"|\?|$)',
+    r'\/([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)(?=\/|"|\?|$)',
+    # 不用引号包围的模式
+    r'\b([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)\b',
+    r'\b([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)\b',
+)
+# 合并为一个交替模式，一次扫描完成；每个模式各占一个捕获组，组号即优先级
+_STANDARD_FILENAME_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in _STANDARD_FILENAME_PATTERNS),
+    re.IGNORECASE
+)
+# 原始文件名：Next.js 路由或 slug 信息
+_ROUTE_FILENAME_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # 在Next.js路由数据中搜索
+    r'"pathname":\s*"[^"]*\/([^"\/]+)"',
+    r'"href":\s*"[^"]*\/([^"\/]+)"',
+    r'"slug":\s*"([^"]+)"',
+    # 在React组件props中搜索
+    r'"params":\s*{[^}]*"slug":\s*"([^"]*)"',
+    r'"query":\s*{[^}]*"slug":\s*"([^"]*)"',
+    # 在页面元数据中搜索
+    r'"page":\s*{[^}]*"slug":\s*"([^"]*)"',
+    r'"route":\s*"[^"]*\/([^"\/]+)"',
+))
+# 原始文件名：被编码的文件名
+_ENCODED_FILENAME_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # 搜索被HTML编码的内容
+    r'&quot;([0-9]{1,2}[-\.][a-zA-Z][a-zA-Z0-9-]*)&quot;',
+    # 搜索被转义的JSON字符串
+    r'\\"([0-9]{1,2}[-\.][a-zA-Z][a-zA-Z0-9-]*)\\"',
+    # 搜索URL编码的内容
+    r'%22([0-9]{1,2}[-\.][a-zA-Z][a-zA-Z0-9-]*)%22',
+))
+# GitHub 仓库链接的多种形式
+_GITHUB_REPO_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # 直接查找 GitHub 链接
+    r'https://github\.com/([^/]+/[^/\s"\'<>]+)',
+    # 从脚本中查找
+    r'github\.com/([^/]+/[^/\s"\'<>]+)',
+    # 从源码链接中查找
+    r'source.*?github\.com/([^/]+/[^/\s"\'<>]+)',
+))
+# commit SHA 的多种形式（模式中含有 commit/sha/blob 等字面单词，需保留忽略大小写）
+_COMMIT_SHA_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # 查找 commit hash 模式（7-40字符的十六进制）
+    r'commit[/_:\s]+([a-f0-9]{7,40})',
+    r'sha[/_:\s]+([a-f0-9]{7,40})',
+    r'revision[/_:\s]+([a-f0-9]{7,40})',
+    # 查找 blob 链接中的 commit
+    r'github\.com/[^/]+/[^/]+/blob/([a-f0-9]{7,40})',
+    # 在脚本数据中查找
+    r'"commit"[^"]*"([a-f0-9]{7,40})"',
+    r'"sha"[^"]*"([a-f0-9]{7,40})"',
+    # 在 meta 标签中查找
+    r'<meta[^>]*content="[^"]*([a-f0-9]{7,40})[^"]*"',
+))
+
+# 单字符转义对应的字符，未列出的转义保持原样
+_SIMPLE_ESCAPES = {
+    'n': '\n',
+    't': '\t',
+    'r': '\r',
+    '"': '"',
+    '/': '/',
+    '\\': '\\',
+}
+
+
+def _normalize_title(title: str) -> str:
+    """规范化标题用于查找：合并空白并转为小写"""
+    return ' '.join(title.split()).lower()
+
+
+def _replace_escape(match) -> str:
+    """_ESCAPE_RE 的替换回调"""
+    code = match.group(1)
+    if code is not None:
+        return chr(int(code, 16))
+    char = match.group(2)
+    return _SIMPLE_ESCAPES.get(char, '\\' + char)
+
+
+# 进程内共享的 Selenium WebDriver，多次转换复用同一个浏览器进程
+_SHARED_DRIVER = None
+# 本工具的用户缓存目录（不放在输出目录中，避免缓存文件被发布到 GitHub Pages）
+_USER_CACHE_DIR = Path.home() / ".cache" / "deepwiki2docsify"
+# 已下载的浏览器驱动路径缓存，避免每次启动都通过 webdriver_manager 联网检查
+_DRIVER_PATH_CACHE = _USER_CACHE_DIR / "drivers.json"
+
+# Edge 和 Chrome 共用的无头浏览器启动参数
+_COMMON_HEADLESS_ARGS = (
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--disable-blink-features=AutomationControlled",
+    # 处理网络连接
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-images",  # 加快加载速度
+    "--disable-javascript-harmony-shipping",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-client-side-phishing-detection",
+    "--disable-sync",
+    "--disable-translate",
+    "--hide-scrollbars",
+    "--mute-audio",
+)
+
+# 在浏览器中一次性筛选出指向序号文件名的链接，只回传 [文本, 文件名]，避免逐个元素往返 WebDriver。
+# 文件名的取法与 _extract_filename_from_href 一致：去掉查询参数和锚点后检查路径的最后两段
+_COLLECT_NAV_LINKS_JS = r"""
+const re = /^[0-9]+(\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*$/;
+const out = [];
+for (const a of document.querySelectorAll('a[href]')) {
+    const text = (a.innerText || '').trim();
+    if (!text) continue;
+    const segs = a.href.split('?')[0].split('#')[0].replace(/^\/+|\/+$/g, '').split('/');
+    let name = segs[segs.length - 1];
+    if (!re.test(name)) name = segs.length >= 2 ? segs[segs.length - 2] : '';
+    if (re.test(name)) out.push([text, name]);
+}
+return out;
+"""
+# 统计页面中的链接数量，用于判断展开操作后是否出现了新链接
+_COUNT_LINKS_JS = "return document.querySelectorAll('a[href]').length;"
+
+# 页面已完成加载且不再显示 Loading... 占位文本时返回 true
+_PAGE_READY_JS = (
+    "return document.readyState === 'complete'"
+    " && !!document.body && !document.body.innerText.includes('Loading...')"
+    " && document.querySelectorAll('script').length > 0"
+)
+
+# 页面加载后在浏览器中一次性执行：隐藏 webdriver 标记、滚动触发懒加载、
+# 展开前 3 个导航元素中可见的折叠项，最后回传 [页面 HTML, 展开数量]
+_SELENIUM_PREPARE_JS = """
+const done = arguments[arguments.length - 1];
+const pause = ms => new Promise(resolve => setTimeout(resolve, ms));
+(async () => {
+    let expanded = 0;
+    try {
+        try {
+            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+        } catch (e) {}
+        window.scrollTo(0, document.body.scrollHeight);
+        await pause(2000);
+        window.scrollTo(0, 0);
+        await pause(2000);
+        const navs = Array.from(document.querySelectorAll(
+            "[class*='nav'], [class*='menu'], [class*='sidebar'], [role='navigation']")).slice(0, 3);
+        for (const nav of navs) {
+            for (const btn of nav.querySelectorAll("[aria-expanded='false'], .collapsed, .expand-btn")) {
+                if (btn.offsetParent !== null) {
+                    btn.click();
+                    expanded++;
+                }
+            }
+        }
+        if (expanded) {
+            await pause(1000);
+        }
+    } catch (e) {}
+    done([document.documentElement.outerHTML, expanded]);
+})();
+"""
+
+
+def _get_shared_driver(factory):
+    """返回进程内共享的 WebDriver，首次调用时由 factory 创建，进程退出时自动关闭"""
+    global _SHARED_DRIVER
+    if _SHARED_DRIVER is None:
+        _SHARED_DRIVER = factory()
+        atexit.register(_quit_shared_driver)
+    return _SHARED_DRIVER
+
+
+def _quit_shared_driver():
+    """关闭共享的 WebDriver"""
+    global _SHARED_DRIVER
+    if _SHARED_DRIVER is not None:
+        try:
+            _SHARED_DRIVER.quit()
+            logger.info("🛑 Selenium WebDriver 已关闭")
+        except Exception as e:
+            logger.debug(f"关闭 WebDriver 失败: {e}")
+        _SHARED_DRIVER = None
+
+
+def _cached_driver_path(name: str, manager_factory, refresh: bool = False) -> tuple:
+    """返回 (浏览器驱动路径, 是否来自缓存)：缓存的驱动文件存在且可执行时直接使用，
+    否则（或 refresh=True 时）通过 webdriver_manager 安装并记录"""
+    try:
+        cached = json.loads(_DRIVER_PATH_CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cached = {}
+    
+    path = cached.get(name)
+    if not refresh and path and os.path.isfile(path) and os.access(path, os.X_OK):
+        logger.debug(f"♻️ 使用缓存的驱动: {path}")
+        return path, True
+    
+    path = manager_factory().install()
+    cached[name] = path
+    try:
+        _DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _DRIVER_PATH_CACHE.write_text(json.dumps(cached, ensure_ascii=False), encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"无法写入驱动路径缓存: {e}")
+    return path, False
+
+
+def _start_webdriver(name: str, label: str, manager_factory, service_cls, driver_cls, options):
+    """用缓存的驱动启动浏览器；缓存的驱动无法启动时（如浏览器升级后版本不匹配）重新安装驱动并重试一次"""
+    try:
+        # 尝试自动下载并设置驱动
+        path, from_cache = _cached_driver_path(name, manager_factory)
+    except Exception as download_error:
+        logger.warning(f"无法下载{label}: {download_error}")
+        # 尝试使用系统已安装的驱动
+        try:
+            service = service_cls()  # 使用默认路径
+        except Exception:
+            raise Exception(f"{label}不可用，无法下载也无法在系统中找到")
+        return driver_cls(service=service, options=options)
+    
+    try:
+        return driver_cls(service=service_cls(path), options=options)
+    except Exception as e:
+        if not from_cache:
+            raise
+        logger.warning(f"⚠️ 缓存的{label}无法启动，可能与浏览器版本不匹配，重新安装后重试: {e}")
+        path, _ = _cached_driver_path(name, manager_factory, refresh=True)
+        return driver_cls(service=service_cls(path), options=options)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_source_link(blob_prefix: str, filename: str, start_line: str, end_line: str = None) -> str:
+    """构造 Sources 中单个链接的 Markdown（end_line 可能为 None）"""
+    if end_line:
+        # 有结束行号：[filename:start-end]
+        return f"[{filename}:{start_line}-{end_line}]({blob_prefix}{filename}#L{start_line}-L{end_line})"
+    # 只有单行：[filename:line]
+    return f"[{filename}:{start_line}]({blob_prefix}{filename}#L{start_line})"
+
+
+def _replace_source_link(blob_prefix: str, link_match) -> str:
+    """_LINK_RE 的替换回调：构造 GitHub 链接（同一文件和行号在多个页面中反复出现，结果会被缓存）"""
+    return _format_source_link(blob_prefix, *link_match.groups())
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_filename_from_href(href: str) -> str:
+    """从href中提取文件名（导航菜单中的 href 大量重复，结果按 href 缓存）"""
+    if not href:
+        return None
+        
+    try:
+        # 移除查询参数和锚点
+        href = href.partition('?')[0].partition('#')[0]
+        
+        # 获取路径的最后一段（只需最后两段，无需拆分整个路径）
+        path_segments = href.strip('/').rsplit('/', 2)
+        if path_segments:
+            filename = path_segments[-1]
+            
+            # 检查是否是有效的序号文件名
+            if _FILENAME_RE.match(filename):
+                return filename
+                
+            # 也检查倒数第二段
+            if len(path_segments) >= 2:
+                filename = path_segments[-2]
+                if _FILENAME_RE.match(filename):
+                    return filename
+                    
+    except Exception as e:
+        logger.debug(f"提取文件名失败: {e}")
+    
+    return None
+
+
+def _page_sort_key(page: dict) -> tuple:
+    """页面排序键：优先使用 slug 或标题开头的序号，其次使用导航顺序"""
+    slug = page.get('slug', '')
+    
+    # 尝试从 slug 中提取序号
+    match = _LEADING_NUM_RE.match(slug)
+    if match:
+        return (int(match[1]), slug)
+    
+    # 尝试从标题中提取序号
+    title = page.get('title', '')
+    match = _LEADING_NUM_RE.match(title)
+    if match:
+        return (int(match[1]), title)
+    
+    # 使用 order 属性（如果有的话），否则按标题排序但放在最后
+    return (page.get('order', 9999), title)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_filename_sequence(filename: str) -> tuple:
+    """解析文件名中的序号信息，返回 (major, minor)，minor 可能为 None；无序号时返回 None"""
+    # 匹配 "1-overview", "1.1-system-architecture" 等格式；格式简单，直接逐字符扫描，不走正则
+    # isdecimal 与正则 \d 的匹配范围一致（isdigit 还会接受 int() 无法解析的上标数字）
+    n = len(filename)
+    i = 0
+    while i < n and filename[i].isdecimal():
+        i += 1
+    if i == 0:
+        return None
+    major = int(filename[:i])
+    
+    minor = None
+    if i < n and filename[i] == '.':
+        j = i + 1
+        while j < n and filename[j].isdecimal():
+            j += 1
+        if j > i + 1:
+            minor = int(filename[i + 1:j])
+            i = j
+    
+    if i < n and filename[i] == '-':
+        return (major, minor)
+    
+    return None
+
+
+# README 中源码仓库链接行的标签：各语言版本及语言选择页（root）
+_REPO_LINK_LABELS = {
+    'zh-cn': '源码仓库',
+    'en': 'Source Repository',
+    'root': '源码仓库 / Source Repository',
+}
+
+
+def _repo_link_line(main_page_info: dict, key: str) -> str:
+    """根据页面信息中的 GitHub 仓库生成 README 的源码仓库链接行，没有仓库信息时返回空字符串"""
+    repo_url = (main_page_info.get('github_info') or {}).get('repo_url')
+    if not repo_url:
+        return ""
+    return f"\n- **{_REPO_LINK_LABELS[key]}**: [{repo_url}]({repo_url})"
+
+
+def _blob_prefix(main_page_info: dict) -> str:
+    """根据页面信息中的 GitHub 仓库生成源码链接前缀（{repo_url}/blob/{commit_sha}/），没有仓库信息时返回 None"""
+    github_info = main_page_info.get('github_info') or {}
+    repo_url = github_info.get('repo_url')
+    if not repo_url:
+        return None
+    return f"{repo_url}/blob/{github_info.get('commit_sha', 'main')}/"
+
+
+def _anchor_text(tag) -> str:
+    """等价于 tag.get_text(strip=True)；只包含单个文本节点时直接取用，无需遍历子节点"""
+    text = tag.string
+    if type(text) is NavigableString:
+        return text.strip()
+    return tag.get_text(strip=True)
+
+
+def _keep_page_tag(name: str, attrs: dict) -> bool:
+    """解析时只保留页面信息和导航链接提取用到的标签（连同其子节点）"""
+    if name in _PAGE_TITLE_TAGS:
+        return True
+    if name == 'a':
+        return 'href' in attrs
+    if attrs.get('data-testid') == 'page-title':
+        return True
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    return 'title' in classes and bool(_TITLE_CLASSES.intersection(classes.split()))
+
+
+_PAGE_STRAINER = SoupStrainer(_keep_page_tag)
+
+
+# index.html 压缩：去掉 HTML 注释、行首缩进和空行
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_HTML_INDENT_RE = re.compile(r'\n\s+')
+
+
+def _minify_html(html: str) -> str:
+    """轻量压缩 HTML 模板（模板中的 CSS/JS 不依赖缩进和换行后的空白）"""
+    return _HTML_INDENT_RE.sub('\n', _HTML_COMMENT_RE.sub('', html))
+
+
+# _write_bytes 打开文件的标志；Windows 上需要 O_BINARY，否则会做换行符转换
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+# 站点公共样式和多语言切换脚本，作为独立文件写入 assets/，index.html 通过链接引用以便浏览器缓存
+_SITE_CSS = _minify_html('''.sidebar {
+  padding-top: 6px;
+}
+.markdown-section {
+  max-width: 800px;
+}
+.app-name-link {
+  color: var(--theme-color, #42b983) !important;
+}
+/* 语言切换按钮样式 */
+.language-switch {
+  position: fixed;
+  top: 20px;
+  right: 20px;
+  z-index: 1000;
+  background: var(--theme-color, #42b983);
+  color: white;
+  border: none;
+  border-radius: 4px;
+  padding: 8px 12px;
+  cursor: pointer;
+  font-size: 14px;
+  text-decoration: none;
+  transition: background-color 0.3s;
+}
+.language-switch:hover {
+  background: var(--theme-color-dark, #369870);
+  color: white;
+}
+.language-menu {
+  position: fixed;
+  top: 60px;
+  right: 20px;
+  z-index: 1000;
+  background: white;
+  border: 1px solid #eee;
+  border-radius: 4px;
+  box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+  display: none;
+  min-width: 120px;
+}
+.language-menu a {
+  display: block;
+  padding: 10px 15px;
+  color: #333;
+  text-decoration: none;
+  border-bottom: 1px solid #eee;
+}
+.language-menu a:last-child {
+  border-bottom: none;
+}
+.language-menu a:hover {
+  background: #f8f9fa;
+}
+.language-menu.show {
+  display: block;
+}
+''')
+
+_LANG_SWITCH_JS = _minify_html('''// 语言切换功能（在脚本中绑定点击事件，脚本执行前点击按钮不会报错）
+function toggleLanguageMenu() {
+  const menu = document.getElementById('languageMenu');
+  menu.classList.toggle('show');
+}
+document.querySelector('.language-switch').addEventListener('click', toggleLanguageMenu);
+
+// 点击页面其他地方关闭菜单
+document.addEventListener('click', function(event) {
+  const menu = document.getElementById('languageMenu');
+  const button = document.querySelector('.language-switch');
+  if (!menu.contains(event.target) && !button.contains(event.target)) {
+    menu.classList.remove('show');
+  }
+});
+''')
+
+
+# index.html 中的 CDN 资源均锁定到具体版本，避免 unpkg 每次解析最新版本的重定向，也便于浏览器长期缓存
+# 多语言版本 index.html 模板，只需替换 $site_name（JS 中的 $ 写作 $$），加载时压缩一次
+_MULTILINGUAL_INDEX_TPL = string.Template(_minify_html('''<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+  <meta charset="UTF-8">
+  <title>$site_name</title>
+  <meta http-equiv="X-UA-Compatible" content="IE=edge,chrome=1" />
+  <meta name="description" content="从 DeepWiki 转换的文档站点">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=1.0">
+  <link rel="stylesheet" href="//unpkg.com/docsify@4.13.1/lib/themes/vue.css">
+  <link rel="stylesheet" href="assets/site.css">
+</head>
+<body>
+  <div id="app">正在加载...</div>
+  
+  <!-- 语言切换菜单 -->
+  <button class="language-switch">
+    🌐 语言 / Language
+  </button>
+  <div class="language-menu" id="languageMenu">
+    <a href="#/zh-cn/">🇨🇳 中文</a>
+    <a href="#/en/">🇺🇸 English</a>
+  </div>
+
+  <script src="assets/lang-switch.js" defer></script>
+  <script>
+    window.$$docsify = {
+      name: '$site_name',
+      repo: '',
+      homepage: 'zh-cn/README.md',
+      loadSidebar: '_sidebar.md',
+      autoHeader: true,
+      subMaxLevel: 3,
+      maxLevel: 4,
+      alias: {
+        '.*zh-cn.*/_sidebar.md': '/zh-cn/_sidebar.md',
+        '.*en.*/_sidebar.md': '/en/_sidebar.md',
+        '/zh-cn/README.md': '/zh-cn/README.md',
+        '/en/README.md': '/en/README.md',
+        '/zh-cn/pages/(.*)': '/zh-cn/pages/$$1',
+        '/en/pages/(.*)': '/en/pages/$$1'
+      },
+      fallbackLanguages: ['zh-cn'],
+      nameLink: {
+        '/zh-cn/': '#/zh-cn/',
+        '/en/': '#/en/',
+        '/': '#/'
+      },
+      search: {
+        maxAge: 86400000,
+        paths: 'auto',
+        placeholder: {
+          '/zh-cn/': '搜索文档...',
+          '/en/': 'Search...',
+          '/': '搜索文档...'
+        },
+        noData: {
+          '/zh-cn/': '没有找到结果',
+          '/en/': 'No results found',
+          '/': '没有找到结果'
+        },
+        depth: 6
+      },
+      copyCode: {
+        buttonText: {
+          '/zh-cn/': '复制代码',
+          '/en/': 'Copy Code',
+          '/': '复制代码'
+        },
+        errorText: {
+          '/zh-cn/': '复制失败',
+          '/en/': 'Copy failed',
+          '/': '复制失败'
+        },
+        successText: {
+          '/zh-cn/': '已复制到剪贴板',
+          '/en/': 'Copied to clipboard',
+          '/': '已复制到剪贴板'
+        }
+      },
+      pagination: {
+        previousText: {
+          '/zh-cn/': '上一页',
+          '/en/': 'Previous',
+          '/': '上一页'
+        },
+        nextText: {
+          '/zh-cn/': '下一页',
+          '/en/': 'Next',
+          '/': '下一页'
+        },
+        crossChapter: true,
+        crossChapterText: true
+      },
+      mermaid: {
+        theme: 'default'
+      }
+    }
+  </script>
+  <!-- Docsify v4 -->
+  <script src="//unpkg.com/docsify@4.13.1"></script>
+  <!-- Mermaid -->
+  <script src="//unpkg.com/mermaid@9.4.3/dist/mermaid.min.js"></script>
+  <script>
+    mermaid.initialize({
+      theme: 'default',
+      startOnLoad: false
+    });
+  </script>
+  <script src="//unpkg.com/docsify-mermaid@1.0.0/dist/docsify-mermaid.js"></script>
+  <!-- 插件 -->
+  <script src="//unpkg.com/docsify@4.13.1/lib/plugins/search.min.js"></script>
+  <script src="//unpkg.com/docsify@4.13.1/lib/plugins/zoom-image.min.js"></script>
+  <script src="//unpkg.com/docsify-copy-code@2.1.1"></script>
+  <script src="//unpkg.com/docsify-pagination@2.10.1/dist/docsify-pagination.min.js"></script>
+</body>
+</html>'''))
+
+# 单语言版本 index.html 模板，只需替换 $site_name（JS 中的 $ 写作 $$），加载时压缩一次
+_INDEX_TPL = string.Template(_minify_html('''<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+  <meta charset="UTF-8">
+  <title>$site_name</title>
+  <meta http-equiv="X-UA-Compatible" content="IE=edge,chrome=1" />
+  <meta name="description" content="从 DeepWiki 转换的文档站点">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=1.0">
+  <link rel="stylesheet" href="//unpkg.com/docsify@4.13.1/lib/themes/vue.css">
+  <link rel="stylesheet" href="assets/site.css">
+</head>
+<body>
+  <div id="app">正在加载...</div>
+  <script>
+    window.$$docsify = {
+      name: '$site_name',
+      repo: '',
+      homepage: 'README.md',
+      loadSidebar: true,
+      autoHeader: true,
+      subMaxLevel: 3,
+      maxLevel: 4,
+      search: {
+        maxAge: 86400000,
+        paths: 'auto',
+        placeholder: '搜索文档...',
+        noData: '没有找到结果',
+        depth: 6
+      },
+      copyCode: {
+        buttonText: '复制代码',
+        errorText: '复制失败',
+        successText: '已复制到剪贴板'
+      },
+      pagination: {
+        previousText: '上一页',
+        nextText: '下一页',
+        crossChapter: true,
+        crossChapterText: true
+      },
+      mermaid: {
+        theme: 'default'
+      }
+    }
+  </script>
+  <!-- Docsify v4 -->
+  <script src="//unpkg.com/docsify@4.13.1"></script>
+  <!-- Mermaid -->
+  <script src="//unpkg.com/mermaid@9.4.3/dist/mermaid.min.js"></script>
+  <script>
+    mermaid.initialize({
+      theme: 'default',
+      startOnLoad: false
+    });
+  </script>
+  <script src="//unpkg.com/docsify-mermaid@1.0.0/dist/docsify-mermaid.js"></script>
+  <!-- 插件 -->
+  <script src="//unpkg.com/docsify@4.13.1/lib/plugins/search.min.js"></script>
+  <script src="//unpkg.com/docsify@4.13.1/lib/plugins/zoom-image.min.js"></script>
+  <script src="//unpkg.com/docsify-copy-code@2.1.1"></script>
+  <script src="//unpkg.com/docsify-pagination@2.10.1/dist/docsify-pagination.min.js"></script>
+</body>
+</html>'''))
+
+
+# 各语言版本 README.md 模板，占位符：$project_name $page_count $url $repo_link $generated_at
+_LANGUAGE_README_TPL = {
+    'zh-cn': string.Template('''# $project_name
+
+> 🚀 从 DeepWiki 转换的文档站点
+
+## 📖 文档导航
+
+本文档包含 **$page_count** 个页面，涵盖了项目的完整技术文档。
+
+### 文档页面
+
+请查看左侧导航栏浏览所有页面，或使用搜索功能快速找到所需内容。
+
+## 🔗 快速链接
+
+- **原始页面**: [$url]($url)$repo_link
+
+## 📝 使用说明
+
+此文档站点支持：
+
+- 📱 响应式设计，支持移动端
+- 🔍 全文搜索功能
+- 🖼️ 图片缩放查看
+- 📋 代码一键复制
+- 📄 分页导航
+- 🌐 中英文切换
+
+---
+
+*生成时间: $generated_at*
+'''),
+    'en': string.Template('''# $project_name
+
+> 🚀 Documentation Site Converted from DeepWiki
+
+## 📖 Documentation Navigation
+
+This documentation contains **$page_count** pages covering the complete technical documentation of the project.
+
+### Documentation Pages
+
+Please browse all pages using the sidebar navigation or use the search function to quickly find the content you need.
+
+## 🔗 Quick Links
+
+- **Original Page**: [$url]($url)$repo_link
+
+## 📝 Features
+
+This documentation site supports:
+
+- 📱 Responsive design for mobile devices
+- 🔍 Full-text search functionality
+- 🖼️ Image zoom viewing
+- 📋 One-click code copying
+- 📄 Page navigation
+- 🌐 Chinese/English switching
+
+---
+
+*Generated: $generated_at*
+'''),
+}
+
+
+class _FetchCache:
+    """基于 SQLite 的页面抓取缓存，按 URL 和抓取方式保存 HTML 及其 ETag/Last-Modified"""
+    
+    def __init__(self, path: Path):
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT NOT NULL, source TEXT NOT NULL, body TEXT NOT NULL, "
+            "etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL, "
+            "PRIMARY KEY (url, source))"
+        )
+        self._conn.commit()
+    
+    def get(self, url: str, source: str) -> dict:
+        """读取缓存条目，不存在时返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM pages WHERE url = ? AND source = ?",
+                (url, source)
+            ).fetchone()
+        if not row:
+            return None
+        return {'body': row[0], 'etag': row[1], 'last_modified': row[2], 'fetched_at': row[3]}
+    
+    def set(self, url: str, source: str, body: str, etag: str = None, last_modified: str = None):
+        """写入（或覆盖）缓存条目"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (url, source, body, etag, last_modified, time.time())
+            )
+            self._conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 
 class DeepWikiToDocsifyConverter:
     """DeepWiki 到 Docsify 转换器"""
     
-    def __init__(self, base_url: str, output_dir: str = "./docs", use_selenium: bool = True, multilingual: bool = False, force_overwrite: bool = False):
+    # 抓取缓存文件，放在用户缓存目录而不是输出目录（输出目录通常会被直接发布）
+    FETCH_CACHE_FILE = _USER_CACHE_DIR / "fetch_cache.sqlite"
+    # 渲染后的页面没有 ETag 可用于校验，按时间过期（秒）
+    RENDERED_CACHE_TTL = 24 * 3600
+    
+    def __init__(self, base_url: str, output_dir: str = "./docs", use_selenium: bool = True, multilingual: bool = False, force_overwrite: bool = False, use_cache: bool = True):
         self.base_url = base_url.rstrip('/')
         self.output_dir = Path(output_dir)
         self.use_selenium = use_selenium and SELENIUM_AVAILABLE
+        # Selenium 不可用时，使用 Playwright 渲染动态内容
+        self.use_playwright = use_selenium and not SELENIUM_AVAILABLE and PLAYWRIGHT_AVAILABLE
         self.multilingual = multilingual
         self.force_overwrite = force_overwrite
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
         })
+        # 网关类错误自动退避重试
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.driver = None
+        self._playwright = None
+        self._playwright_browser = None
+        self._playwright_context = None
+        self._playwright_loop = None
         
         # 检查输出目录
         self._check_output_directory()
@@ -74,10 +944,29 @@ class DeepWikiToDocsifyConverter:
         
         # 存储处理的页面和资源
         self.processed_pages = []
+        # 页面所在的 URL 路径段（如 owner/repo），由 _create_page_files 记录
+        self.processed_path_parts = ()
+        # slug -> 实际写入的相对路径，在页面创建完成后一次性建立
+        self._slug_to_file = {}
+        # 多语言模式下每种语言的 slug -> 侧边栏链接路径，由 _create_page_files 建立
+        self._lang_slug_to_file = {}
         self.downloaded_assets = []
+        # 生成时间，convert() 开始时刷新
+        self._generated_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # 页面抓取缓存（可选优化，缓存目录不可写时直接禁用）
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = _FetchCache(self.FETCH_CACHE_FILE)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"⚠️ 无法打开页面缓存，本次运行不使用缓存: {e}")
+        self._cache_hits = set()
         
         if self.use_selenium:
             self._setup_selenium()
+        elif self.use_playwright:
+            self._setup_playwright()
     
     def _check_output_directory(self):
         """检查输出目录是否为空，如果不为空则提示用户"""
@@ -127,28 +1016,40 @@ class DeepWikiToDocsifyConverter:
         
         ignore_patterns = {'.DS_Store', 'Thumbs.db', '.gitkeep', '.gitignore'}
         
+        def remove(entry):
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+                logger.debug(f"🗑️ 删除目录: {entry.name}")
+            else:
+                os.unlink(entry.path)
+                logger.debug(f"🗑️ 删除文件: {entry.name}")
+        
         try:
-            for item in self.output_dir.iterdir():
+            # os.scandir 直接提供文件类型信息，无需逐项再次 stat
+            with os.scandir(self.output_dir) as it:
                 # 跳过隐藏文件和系统文件
-                if item.name in ignore_patterns or item.name.startswith('.'):
-                    continue
+                entries = [entry for entry in it
+                           if entry.name not in ignore_patterns and not entry.name.startswith('.')]
+            
+            if entries:
+                # 并行删除，重叠各项的文件系统 I/O
+                with ThreadPoolExecutor(max_workers=min(16, len(entries))) as executor:
+                    futures = [(entry, executor.submit(remove, entry)) for entry in entries]
                 
-                try:
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                        logger.debug(f"🗑️ 删除目录: {item.name}")
-                    else:
-                        item.unlink()
-                        logger.debug(f"🗑️ 删除文件: {item.name}")
-                except Exception as e:
-                    logger.warning(f"⚠️ 无法删除 {item.name}: {e}")
+                for entry, future in futures:
+                    if future.exception():
+                        logger.warning(f"⚠️ 无法删除 {entry.name}: {future.exception()}")
                     
         except Exception as e:
             logger.error(f"❌ 清空目录失败: {e}")
             raise Exception(f"无法清空输出目录: {e}")
     
     def _setup_selenium(self):
-        """设置 Selenium WebDriver（优先使用Edge，备选Chrome），支持重试机制"""
+        """设置 Selenium WebDriver，同一进程内复用已启动的浏览器"""
+        self.driver = _get_shared_driver(self._start_selenium)
+    
+    def _start_selenium(self):
+        """启动 Selenium WebDriver（优先使用Edge，备选Chrome），支持重试机制"""
         max_retries = 3
         retry_delay = 2  # 重试间隔秒数
         
@@ -159,12 +1060,12 @@ class DeepWikiToDocsifyConverter:
                 # 首先尝试使用 Microsoft Edge
                 edge_success = self._try_setup_edge(attempt + 1)
                 if edge_success:
-                    return
+                    return self.driver
                 
                 # 如果Edge失败，尝试Chrome
                 chrome_success = self._try_setup_chrome(attempt + 1)
                 if chrome_success:
-                    return
+                    return self.driver
                 
                 # 如果这次尝试失败，但还有重试机会
                 if attempt < max_retries - 1:
@@ -191,42 +1092,12 @@ class DeepWikiToDocsifyConverter:
         try:
             logger.info(f"🔄 第 {attempt_num} 次尝试启动 Microsoft Edge WebDriver...")
             edge_options = EdgeOptions()
-            edge_options.add_argument("--headless")
-            edge_options.add_argument("--no-sandbox")
-            edge_options.add_argument("--disable-dev-shm-usage")
-            edge_options.add_argument("--disable-gpu")
-            edge_options.add_argument("--window-size=1920,1080")
-            edge_options.add_argument("--disable-blink-features=AutomationControlled")
+            for arg in _COMMON_HEADLESS_ARGS:
+                edge_options.add_argument(arg)
             edge_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             edge_options.add_experimental_option('useAutomationExtension', False)
-            # 添加更多选项来处理网络连接
-            edge_options.add_argument("--disable-web-security")
-            edge_options.add_argument("--allow-running-insecure-content")
-            edge_options.add_argument("--disable-extensions")
-            edge_options.add_argument("--disable-plugins")
-            edge_options.add_argument("--disable-images")  # 加快加载速度
-            edge_options.add_argument("--disable-javascript-harmony-shipping")
-            edge_options.add_argument("--disable-background-timer-throttling")
-            edge_options.add_argument("--disable-renderer-backgrounding")
-            edge_options.add_argument("--disable-backgrounding-occluded-windows")
-            edge_options.add_argument("--disable-client-side-phishing-detection")
-            edge_options.add_argument("--disable-sync")
-            edge_options.add_argument("--disable-translate")
-            edge_options.add_argument("--hide-scrollbars")
-            edge_options.add_argument("--mute-audio")
-            
-            try:
-                # 尝试自动下载并设置 EdgeDriver
-                edge_service = EdgeService(EdgeChromiumDriverManager().install())
-            except Exception as download_error:
-                logger.warning(f"无法下载EdgeDriver: {download_error}")
-                # 尝试使用系统已安装的EdgeDriver
-                try:
-                    edge_service = EdgeService()  # 使用默认路径
-                except:
-                    raise Exception("EdgeDriver不可用，无法下载也无法在系统中找到")
             
-            self.driver = webdriver.Edge(service=edge_service, options=edge_options)
+            self.driver = _start_webdriver('edge', 'EdgeDriver', EdgeChromiumDriverManager, EdgeService, webdriver.Edge, edge_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
             # 设置超时
@@ -245,41 +1116,12 @@ class DeepWikiToDocsifyConverter:
         try:
             logger.info(f"🔄 第 {attempt_num} 次尝试启动 Chrome WebDriver...")
             chrome_options = ChromeOptions()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            for arg in _COMMON_HEADLESS_ARGS:
+                chrome_options.add_argument(arg)
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-images")
-            chrome_options.add_argument("--disable-javascript-harmony-shipping")
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-client-side-phishing-detection")
-            chrome_options.add_argument("--disable-sync")
-            chrome_options.add_argument("--disable-translate")
-            chrome_options.add_argument("--hide-scrollbars")
-            chrome_options.add_argument("--mute-audio")
             
-            try:
-                # 尝试自动下载并设置 ChromeDriver
-                chrome_service = ChromeService(ChromeDriverManager().install())
-            except Exception as download_error:
-                logger.warning(f"无法下载ChromeDriver: {download_error}")
-                # 尝试使用系统已安装的ChromeDriver
-                try:
-                    chrome_service = ChromeService()  # 使用默认路径
-                except:
-                    raise Exception("ChromeDriver不可用，无法下载也无法在系统中找到")
-            
-            self.driver = webdriver.Chrome(service=chrome_service, options=chrome_options)
+            self.driver = _start_webdriver('chrome', 'ChromeDriver', ChromeDriverManager, ChromeService, webdriver.Chrome, chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
             # 设置超时
@@ -293,137 +1135,229 @@ class DeepWikiToDocsifyConverter:
             logger.warning(f"Chrome 第 {attempt_num} 次启动失败: {chrome_error}")
             return False
     
+    def _setup_playwright(self):
+        """启动 Playwright 浏览器，并创建一个在所有页面间复用的浏览器上下文"""
+        self._playwright_loop = asyncio.new_event_loop()
+        try:
+            logger.info("🔄 尝试启动 Playwright Chromium...")
+            self._playwright_loop.run_until_complete(self._start_playwright())
+            logger.info("🚀 Playwright Chromium 已启动")
+        except Exception as e:
+            logger.warning(f"⚠️ Playwright 启动失败，将使用基础模式: {e}")
+            self._close_playwright()
+            self.use_playwright = False
+    
+    async def _start_playwright(self):
+        """启动 Playwright、浏览器和共享的浏览器上下文"""
+        self._playwright = await async_playwright().start()
+        self._playwright_browser = await self._playwright.chromium.launch(headless=True)
+        self._playwright_context = await self._playwright_browser.new_context(
+            user_agent=self.session.headers['User-Agent'],
+            viewport={'width': 1920, 'height': 1080}
+        )
+    
+    def _close_playwright(self):
+        """关闭 Playwright 浏览器及其事件循环"""
+        if not self._playwright_loop:
+            return
+        
+        async def stop():
+            if self._playwright_browser:
+                await self._playwright_browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        
+        try:
+            self._playwright_loop.run_until_complete(stop())
+            logger.info("🛑 Playwright 已关闭")
+        except Exception as e:
+            logger.debug(f"关闭 Playwright 失败: {e}")
+        finally:
+            self._playwright_loop.close()
+            self._playwright_loop = None
+            self._playwright = None
+            self._playwright_browser = None
+            self._playwright_context = None
+    
     def _get_page_content(self, url: str) -> str:
         """获取页面内容"""
         if self.use_selenium and self.driver:
             return self._get_page_with_selenium(url)
+        elif self.use_playwright:
+            return self._get_page_with_playwright(url)
         else:
             return self._get_page_with_requests(url)
     
+    def _cache_get(self, url: str, source: str) -> dict:
+        """读取缓存条目；缓存不可用或读取出错时返回 None，不影响抓取"""
+        if not self.cache:
+            return None
+        
+        try:
+            return self.cache.get(url, source)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 读取页面缓存失败: {e}")
+            return None
+    
+    def _cache_set(self, url: str, source: str, body: str, etag: str = None, last_modified: str = None):
+        """写入缓存条目；写入出错时只记录警告，不影响抓取结果"""
+        if not self.cache:
+            return
+        
+        try:
+            self.cache.set(url, source, body, etag, last_modified)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 写入页面缓存失败: {e}")
+    
+    def _get_cached_render(self, url: str, source: str) -> str:
+        """读取未过期的渲染页面缓存，没有则返回 None"""
+        entry = self._cache_get(url, source)
+        if entry and time.time() - entry['fetched_at'] < self.RENDERED_CACHE_TTL:
+            logger.info(f"♻️ 使用缓存的渲染页面: {url}")
+            self._cache_hits.add(url)
+            return entry['body']
+        return None
+    
     def _get_page_with_selenium(self, url: str) -> str:
         """使用 Selenium 获取页面内容（等待动态加载）"""
+        cached = self._get_cached_render(url, 'selenium')
+        if cached is not None:
+            return cached
+        
         try:
             logger.info(f"🔄 正在加载页面（Selenium）: {url}")
             self.driver.get(url)
             
-            # 等待页面基本加载
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # 等待更长时间让内容加载
+            # 轮询页面就绪状态，内容加载完成后立即继续，不再固定等待
             logger.info("⏳ 等待JavaScript执行完成...")
-            time.sleep(8)  # 增加等待时间
-            
-            # 尝试等待内容加载完成（检查是否还有 Loading... 文本）
             try:
-                WebDriverWait(self.driver, 15).until_not(
-                    EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "Loading...")
+                WebDriverWait(self.driver, 20, poll_frequency=0.25).until(
+                    lambda driver: driver.execute_script(_PAGE_READY_JS)
                 )
                 logger.info("✅ 动态内容已加载")
-            except:
+            except TimeoutException:
                 logger.warning("⚠️ 页面可能仍在加载中，继续处理")
             
-            # 额外等待确保所有异步内容都加载完成
-            logger.info("🔍 等待异步内容加载...")
-            time.sleep(5)
-            
-            # 尝试触发一些用户交互来确保所有内容都被渲染
+            # 在一次异步脚本调用中完成滚动、展开导航并取回页面源码，减少 WebDriver 往返
             try:
-                # 滚动页面以触发懒加载内容
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
-                
-                # 检查是否有导航菜单并尝试展开
-                nav_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                    "[class*='nav'], [class*='menu'], [class*='sidebar'], [role='navigation']")
-                if nav_elements:
-                    logger.info(f"🔍 发现 {len(nav_elements)} 个导航元素")
-                    for nav in nav_elements[:3]:  # 只处理前3个
-                        try:
-                            # 尝试点击可能的展开按钮
-                            expandable = nav.find_elements(By.CSS_SELECTOR, 
-                                "[aria-expanded='false'], .collapsed, .expand-btn")
-                            for btn in expandable:
-                                if btn.is_displayed():
-                                    btn.click()
-                                    time.sleep(1)
-                        except:
-                            pass
-                            
+                page_source, expanded = self.driver.execute_async_script(_SELENIUM_PREPARE_JS)
+                if expanded:
+                    logger.info(f"🔍 展开了 {expanded} 个导航项")
             except Exception as e:
                 logger.debug(f"交互操作失败: {e}")
+                page_source = self.driver.page_source
             
-            # 获取最终的页面源码
-            page_source = self.driver.page_source
             logger.info(f"📄 获取页面源码: {len(page_source)} 字符")
             
+            self._cache_set(url, 'selenium', page_source)
             return page_source
             
         except Exception as e:
             logger.error(f"Selenium 获取页面失败: {e}")
             return self._get_page_with_requests(url)
     
+    def _get_page_with_playwright(self, url: str) -> str:
+        """使用 Playwright 获取页面内容（等待动态加载）"""
+        cached = self._get_cached_render(url, 'playwright')
+        if cached is not None:
+            return cached
+        
+        async def fetch() -> str:
+            logger.info(f"🔄 正在加载页面（Playwright）: {url}")
+            page = await self._playwright_context.new_page()
+            try:
+                # 等待网络空闲，而不是固定休眠
+                await page.goto(url, wait_until='networkidle', timeout=60000)
+                try:
+                    await page.wait_for_function(
+                        "() => !document.body.innerText.includes('Loading...')", timeout=15000
+                    )
+                    logger.info("✅ 动态内容已加载")
+                except PlaywrightTimeoutError:
+                    logger.warning("⚠️ 页面可能仍在加载中，继续处理")
+                
+                page_source = await page.content()
+                logger.info(f"📄 获取页面源码: {len(page_source)} 字符")
+                return page_source
+            finally:
+                await page.close()
+        
+        try:
+            page_source = self._playwright_loop.run_until_complete(fetch())
+        except Exception as e:
+            logger.error(f"Playwright 获取页面失败: {e}")
+            return self._get_page_with_requests(url)
+        
+        self._cache_set(url, 'playwright', page_source)
+        return page_source
+    
     def _get_page_with_requests(self, url: str) -> str:
         """使用 requests 获取页面内容"""
+        entry = self._cache_get(url, 'requests')
+        
         try:
             logger.info(f"📡 正在获取页面: {url}")
-            response = self.session.get(url, timeout=30)
+            # 有缓存时发送条件请求，页面未修改则直接复用缓存
+            headers = {}
+            if entry and entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry and entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+            
+            response = self.session.get(url, timeout=30, headers=headers)
+            if entry and response.status_code == 304:
+                logger.info(f"♻️ 页面未修改，使用缓存: {url}")
+                self._cache_hits.add(url)
+                return entry['body']
+            
             response.raise_for_status()
+            self._cache_set(url, 'requests', response.text,
+                            response.headers.get('ETag'), response.headers.get('Last-Modified'))
             return response.text
         except Exception as e:
+            if entry:
+                logger.warning(f"⚠️ 获取页面失败，使用缓存内容: {e}")
+                self._cache_hits.add(url)
+                return entry['body']
             logger.error(f"获取页面失败: {e}")
             return ""
     
     def _safe_decode_unicode(self, text):
         """改进的 Unicode 解码，更好地处理转义字符"""
-        try:
-            # 首先处理常见的转义序列
-            text = text.replace('\\n', '\n')
-            text = text.replace('\\t', '\t')
-            text = text.replace('\\r', '\r')
-            text = text.replace('\\"', '"')
-            text = text.replace('\\/', '/')
-            text = text.replace('\\\\', '\\')  # 处理双反斜杠
-            
-            # 处理 Unicode 转义
-            text = text.replace('\\u003c', '<')
-            text = text.replace('\\u003e', '>')
-            text = text.replace('\\u0026', '&')
-            text = text.replace('\\u0027', "'")
-            
-            # 处理其他 Unicode 转义序列
-            def replace_unicode(match):
-                try:
-                    return chr(int(match.group(1), 16))
-                except:
-                    return match.group(0)
-            
-            text = re.sub(r'\\u([0-9a-fA-F]{4})', replace_unicode, text)
-            
+        # 没有反斜杠就不可能有转义序列，直接返回原文
+        if '\\' not in text:
             return text
+        
+        try:
+            # 一次扫描同时处理常见转义序列和 Unicode 转义
+            return _ESCAPE_RE.sub(_replace_escape, text)
         except Exception as e:
             logger.debug(f"Unicode 解码失败: {e}")
             return text
     
     def _extract_nextjs_content(self, html_content: str, navigation_links: dict = None) -> tuple:
         """从 Next.js 的异步内容中提取页面和导航结构"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 存储页面片段
+        # 存储页面片段：所有片段以 UTF-8 字节追加到同一个临时文件，每个页面只记录片段的 (偏移, 长度)，
+        # 避免所有原始片段同时驻留内存，也不会为每个页面各占用一个文件描述符
         page_fragments = {}
+        spill_offset = 0
         navigation_structure = []
         
-        # 查找所有包含内容的脚本
-        scripts = soup.find_all('script')
-        
-        logger.info(f"🔍 分析 {len(scripts)} 个脚本标签...")
+        # 导航链接按规范化标题建立一次索引，容忍大小写和空白差异
+        nav_lookup = {_normalize_title(title): filename
+                      for title, filename in (navigation_links or {}).items()}
         
-        for i, script in enumerate(scripts):
-            if script.string and 'self.__next_f.push' in script.string:
-                script_content = script.string
+        with tempfile.TemporaryFile() as spill_file:
+            # 直接从原始 HTML 中取出脚本内容，无需为整个页面构建 DOM 树
+            script_count = 0
+            data_script_count = 0
+            
+            for script_match in _SCRIPT_RE.finditer(html_content):
+                script_count += 1
+                script_content = script_match.group(1)
+                if 'self.__next_f.push' not in script_content:
+                    continue
+                data_script_count += 1
                 
                 # 提取导航结构
                 nav_structure = self._extract_navigation_structure(script_content)
@@ -431,7 +1365,7 @@ class DeepWikiToDocsifyConverter:
                     navigation_structure.extend(nav_structure)
                 
                 # 提取这个脚本中的所有内容片段
-                fragments = self._extract_all_content_fragments(script_content, navigation_links)
+                fragments = self._extract_all_content_fragments(script_content, nav_lookup)
                 
                 for fragment in fragments:
                     title = fragment['title']
@@ -440,88 +1374,80 @@ class DeepWikiToDocsifyConverter:
                     
                     if title not in page_fragments:
                         page_fragments[title] = {
-                            'contents': [],
+                            'spans': [],
                             'original_filename': original_filename
                         }
                     
-                    page_fragments[title]['contents'].append(content)
+                    # 以二进制写入，读回时内容原样保留（不做换行符转换）
+                    data = content.encode('utf-8') + b'\n'
+                    spill_file.write(data)
+                    page_fragments[title]['spans'].append((spill_offset, len(data)))
+                    spill_offset += len(data)
                     # 如果有原始文件名，保留第一个找到的
                     if original_filename and not page_fragments[title]['original_filename']:
                         page_fragments[title]['original_filename'] = original_filename
-        
-        # 合并每个页面的所有片段
-        final_pages = []
-        for title, page_data in page_fragments.items():
-            # 合并内容
-            merged_content = '\n'.join(page_data['contents'])
             
-            # 清理合并后的内容
-            cleaned_content = self._clean_merged_content(merged_content)
+            logger.info(f"🔍 分析了 {script_count} 个脚本标签，其中 {data_script_count} 个包含页面数据")
             
-            if cleaned_content and len(cleaned_content) > 100:
-                original_filename = page_data.get('original_filename')
-                slug = self._generate_slug(title, original_filename)
+            # 标题到顺序的只读索引，保留首次出现的顺序，与线性查找结果一致
+            nav_order = {}
+            for nav_item in navigation_structure:
+                nav_order.setdefault(nav_item['title'], nav_item['order'])
+            nav_order = types.MappingProxyType(nav_order)
+            
+            # 合并每个页面的所有片段
+            final_pages = []
+            # 先取出标题列表再逐个弹出：按插入顺序处理，处理完的条目随即释放；
+            # 不在循环中反复 next(iter(...))，那样每次都要重新扫过已删除的槽位，整体是平方复杂度
+            for title in list(page_fragments):
+                page_data = page_fragments.pop(title)
                 
-                final_pages.append({
-                    'title': title,
-                    'content': cleaned_content,
-                    'slug': slug,
-                    'original_filename': original_filename,
-                    'order': self._get_page_order_from_nav(title, navigation_structure)
-                })
+                # 按记录的偏移读回该页面的所有片段并合并
+                chunks = []
+                for offset, length in page_data['spans']:
+                    spill_file.seek(offset)
+                    chunks.append(spill_file.read(length))
+                merged_content = b''.join(chunks).decode('utf-8')
+                del chunks
+                
+                # 清理合并后的内容，原始合并文本不再需要
+                cleaned_content = self._clean_merged_content(merged_content)
+                del merged_content
+                
+                if cleaned_content and len(cleaned_content) > 100:
+                    original_filename = page_data.get('original_filename')
+                    slug = self._generate_slug(title, original_filename)
+                    
+                    final_pages.append({
+                        'title': title,
+                        'content': cleaned_content,
+                        'slug': slug,
+                        'original_filename': original_filename,
+                        'order': self._get_page_order_from_nav(title, nav_order)
+                    })
         
         logger.info(f"📄 提取到 {len(final_pages)} 个完整页面")
         logger.info(f"📋 提取到导航结构: {len(navigation_structure)} 个条目")
         
         return final_pages, navigation_structure
     
-    def _extract_all_content_fragments(self, script_content: str, navigation_links: dict = None) -> list:
-        """提取脚本中的所有内容片段，正确处理嵌套引号"""
+    def _extract_all_content_fragments(self, script_content: str, nav_lookup: dict = None) -> list:
+        """提取脚本中的所有内容片段，正确处理嵌套引号（nav_lookup 以规范化标题为键）"""
         fragments = []
         
         # 使用更智能的方法来提取内容，正确处理嵌套引号
-        pattern = r'self\.__next_f\.push\(\[1,"'
-        matches = list(re.finditer(pattern, script_content))
-        
-        for match in matches:
-            start_pos = match.end()
-            
-            # 从这个位置开始，找到匹配的结束引号
-            content = ""
-            pos = start_pos
-            escape_next = False
-            
-            while pos < len(script_content):
-                char = script_content[pos]
-                
-                if escape_next:
-                    content += char
-                    escape_next = False
-                elif char == '\\':
-                    content += char
-                    escape_next = True
-                elif char == '"':
-                    # 找到结束引号
-                    break
-                else:
-                    content += char
-                
-                pos += 1
-            
-            # 安全解码
-            decoded_content = self._safe_decode_unicode(content)
+        for match in _PUSH_RE.finditer(script_content):
+            decoded_content = self._decode_push_payload(script_content, match.end())
             
             # 检查是否包含有效内容
             if len(decoded_content.strip()) > 20:
                 # 尝试识别标题和原始文件名
                 title = self._extract_title_from_content(decoded_content)
-                original_filename = self._extract_original_filename(decoded_content)
                 
                 if title:
-                    # 优先从导航链接中获取真实文件名
-                    real_filename = None
-                    if navigation_links and title in navigation_links:
-                        real_filename = navigation_links[title]
+                    # 优先从导航链接中获取真实文件名，未命中时才扫描内容
+                    real_filename = nav_lookup.get(_normalize_title(title)) if nav_lookup else None
+                    if real_filename:
                         logger.info(f"🎯 使用导航链接文件名: {title} -> {real_filename}")
                     else:
                         # 如果导航链接中没有，尝试从内容中提取
@@ -539,41 +1465,61 @@ class DeepWikiToDocsifyConverter:
         
         return fragments
     
+    def _decode_push_payload(self, script_content: str, start: int) -> str:
+        """解码从 start 开始的 [1,"..."] 推送参数，返回其中的字符串内容"""
+        # 推送参数是合法的 JSON 数组，直接交给 C 实现的 JSON 解码器，一次完成定界和转义解码
+        try:
+            payload, _ = _JSON_DECODER.raw_decode(script_content, start)
+            if isinstance(payload, list) and len(payload) > 1 and isinstance(payload[1], str):
+                return payload[1]
+        except ValueError as e:
+            logger.debug(f"JSON 解码推送数据失败，改用手动解析: {e}")
+        
+        # 回退：手动找到匹配的结束引号，再安全解码
+        content = self._read_js_string(script_content, start + len(_PUSH_ARGS_PREFIX))
+        if '\\' not in content:
+            return content
+        return self._safe_decode_unicode(content)
+    
+    def _read_js_string(self, text: str, start: int) -> str:
+        """读取从 start 开始的 JS 字符串字面量内容（不含结束引号，保留转义序列）"""
+        parts = []
+        pos = start
+        next_quote = text.find('"', pos)
+        
+        while True:
+            next_backslash = text.find('\\', pos)
+            if next_backslash != -1 and (next_quote == -1 or next_backslash < next_quote):
+                # 转义字符连同其后的一个字符原样保留
+                parts.append(text[pos:next_backslash + 2])
+                pos = next_backslash + 2
+                if next_quote != -1 and next_quote < pos:
+                    next_quote = text.find('"', pos)
+                continue
+            
+            # 找到结束引号（或到达文本末尾）
+            parts.append(text[pos:next_quote] if next_quote != -1 else text[pos:])
+            break
+        
+        return ''.join(parts)
+    
     def _extract_navigation_structure(self, script_content: str) -> list:
         """提取 DeepWiki 的导航结构"""
         navigation = []
         
         try:
-            # 专门搜索包含路由信息的数据结构
+            # 专门搜索包含路由信息的数据结构（路由、页面、侧边栏配置等）
             # 这些可能包含真实的文件名
-            route_patterns = [
-                # 搜索路由配置
-                r'"routes?":\s*\[([^\]]+)\]',
-                r'"paths?":\s*\[([^\]]+)\]',
-                r'"links?":\s*\[([^\]]+)\]',
-                # 搜索页面配置
-                r'"pages":\s*\[([^\]]+)\]',
-                r'"navigation":\s*\[([^\]]+)\]',
-                r'"sidebar":\s*\[([^\]]+)\]',
-                r'"menuItems":\s*\[([^\]]+)\]',
-                # 搜索Next.js路由数据
-                r'"__NEXT_DATA__"[^{]*{[^}]*"page"[^}]*}',
-                # 搜索包含href或path的对象
-                r'\{[^}]*"(?:href|path|route)":\s*"[^"]*\/([0-9]+(?:\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*)"[^}]*\}',
-            ]
-            
-            logger.debug(f"🔍 在 {len(script_content)} 字符的脚本中搜索导航结构...")
-            
-            for pattern in route_patterns:
-                matches = re.finditer(pattern, script_content, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    logger.debug(f"📝 找到模式匹配: {pattern[:50]}...")
-                    if match.groups():
-                        nav_content = match.group(1) if len(match.groups()) >= 1 else match.group(0)
-                        nav_items = self._parse_navigation_items(nav_content)
-                        if nav_items:
-                            navigation.extend(nav_items)
-                            logger.info(f"📋 从模式中提取到 {len(nav_items)} 个导航项")
+            lowered_script = script_content.lower()
+            if any(key in lowered_script for key in _NAV_KEYS):
+                logger.debug(f"🔍 在 {len(script_content)} 字符的脚本中搜索导航结构...")
+                
+                for match in _NAV_DATA_RE.finditer(script_content):
+                    logger.debug(f"📝 找到导航数据: {match.group('key')}")
+                    nav_items = self._parse_navigation_items(match.group('items'))
+                    if nav_items:
+                        navigation.extend(nav_items)
+                        logger.info(f"📋 从模式中提取到 {len(nav_items)} 个导航项")
             
             # 如果没有找到明确的导航结构，尝试从页面顺序推断
             if not navigation:
@@ -590,11 +1536,7 @@ class DeepWikiToDocsifyConverter:
         items = []
         try:
             # 首先搜索包含路径信息的完整对象
-            filename_objects = re.findall(
-                r'\{[^}]*(?:"title":\s*"([^"]+)")[^}]*(?:"(?:href|path|route)":\s*"[^"]*\/([0-9]+(?:\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*)"[^}]*|[^}]*"(?:href|path|route)":\s*"[^"]*\/([0-9]+(?:\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*)"[^}]*"title":\s*"([^"]+)")[^}]*\}',
-                nav_content,
-                re.IGNORECASE
-            )
+            filename_objects = _NAV_FILENAME_OBJECT_RE.findall(nav_content)
             
             if filename_objects:
                 logger.info(f"🎯 找到包含文件名的导航对象: {len(filename_objects)} 个")
@@ -614,13 +1556,9 @@ class DeepWikiToDocsifyConverter:
             if not items:
                 # 尝试解析 JSON 格式的导航项
                 # 简化处理，查找标题和顺序信息
-                title_pattern = r'"title":\s*"([^"]+)"'
-                order_pattern = r'"order":\s*(\d+)'
-                level_pattern = r'"level":\s*(\d+)'
-                
-                titles = re.findall(title_pattern, nav_content)
-                orders = re.findall(order_pattern, nav_content)
-                levels = re.findall(level_pattern, nav_content)
+                titles = _TITLE_RE.findall(nav_content)
+                orders = _ORDER_RE.findall(nav_content)
+                levels = _LEVEL_RE.findall(nav_content)
                 
                 for i, title in enumerate(titles):
                     item = {
@@ -641,11 +1579,8 @@ class DeepWikiToDocsifyConverter:
         
         try:
             # 查找所有页面标题的出现顺序
-            title_pattern = r'# ([^#\n]+)'
-            matches = re.finditer(title_pattern, script_content)
-            
             order = 0
-            for match in matches:
+            for match in _HEADING_RE.finditer(script_content):
                 title = match.group(1).strip()
                 if len(title) > 2 and not title.startswith('#'):
                     items.append({
@@ -660,64 +1595,54 @@ class DeepWikiToDocsifyConverter:
         
         return items
     
-    def _get_page_order_from_nav(self, page_title: str, navigation: list) -> int:
-        """从导航结构中获取页面顺序"""
-        for nav_item in navigation:
-            if nav_item['title'] == page_title:
-                return nav_item['order']
-        
+    def _get_page_order_from_nav(self, page_title: str, nav_order) -> int:
+        """从标题到顺序的导航索引中获取页面顺序"""
         # 如果没找到，返回较大的数字，排在最后
-        return 9999
+        return nav_order.get(page_title, 9999)
     
     def _extract_title_from_content(self, content: str) -> str:
         """从内容中提取标题"""
-        lines = content.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('# ') and not line.startswith('# #'):
-                return line.lstrip('#').strip()
-        
-        return None
+        # 直接搜索第一个一级标题行，无需把整个片段拆分成行列表
+        match = _H1_RE.search(content)
+        return match.group(1).strip() if match else None
     
-    def _process_sources_links(self, content: str, github_info: dict) -> str:
+    def _process_sources_links(self, content: str, blob_prefix: str) -> str:
         """处理 Sources 链接，补全 GitHub 地址"""
-        if not github_info or not github_info.get('repo_url'):
+        if not blob_prefix or 'Sources:' not in content:
             return content
         
-        repo_url = github_info['repo_url']
-        commit_sha = github_info.get('commit_sha', 'main')
-        
-        # 匹配 Sources 行中的链接格式：[filename:line1-line2]() 或 [filename:line1]()
-        sources_pattern = r'Sources:\s*(.+?)(?=\n|$)'
-        link_pattern = r'\[([^:]+):(\d+)(?:-(\d+))?\]\(\)'
-        
-        def replace_sources_line(match):
-            sources_line = match.group(1)
-            
-            def replace_single_link(link_match):
-                filename = link_match.group(1)
-                start_line = link_match.group(2)
-                end_line = link_match.group(3)  # 可能为 None
-                
-                # 构造 GitHub 链接
-                if end_line:
-                    # 有结束行号：[filename:start-end]
-                    github_link = f"{repo_url}/blob/{commit_sha}/{filename}#L{start_line}-L{end_line}"
-                    return f"[{filename}:{start_line}-{end_line}]({github_link})"
-                else:
-                    # 只有单行：[filename:line]
-                    github_link = f"{repo_url}/blob/{commit_sha}/{filename}#L{start_line}"
-                    return f"[{filename}:{start_line}]({github_link})"
-            
-            updated_line = re.sub(link_pattern, replace_single_link, sources_line)
-            return f"Sources: {updated_line}"
-        
+        replace_link = functools.partial(_replace_source_link, blob_prefix)
         # 替换所有 Sources 行
-        processed_content = re.sub(sources_pattern, replace_sources_line, content, flags=re.MULTILINE)
+        return _SOURCES_RE.sub(
+            lambda match: f"Sources: {_LINK_RE.sub(replace_link, match.group(1))}", content
+        )
+
+    def _get_dynamic_navigation(self, html_content: str) -> dict:
+        """提取主页的动态导航数据，并与页面 HTML 一起缓存；
+        HTML 来自缓存时使用未过期的缓存导航结果，保证多次运行生成相同的文件名和侧边栏"""
+        if self.base_url in self._cache_hits:
+            entry = self._cache_get(self.base_url, 'selenium-nav')
+            if entry and time.time() - entry['fetched_at'] < self.RENDERED_CACHE_TTL:
+                logger.info("♻️ 使用缓存的动态导航数据")
+                return json.loads(entry['body'])
+            
+            # 缓存中没有未过期的导航结果，浏览器尚未打开该页面，先加载再提取
+            logger.info(f"🔄 缓存中没有可用的动态导航数据，重新加载页面: {self.base_url}")
+            try:
+                self.driver.get(self.base_url)
+                WebDriverWait(self.driver, 20, poll_frequency=0.25).until(
+                    lambda driver: driver.execute_script(_PAGE_READY_JS)
+                )
+            except TimeoutException:
+                logger.warning("⚠️ 页面可能仍在加载中，继续处理")
+            except Exception as e:
+                logger.warning(f"⚠️ 加载页面失败，跳过动态导航数据提取: {e}")
+                return {}
         
-        return processed_content
-
+        navigation_data = self._extract_dynamic_navigation_data(html_content)
+        self._cache_set(self.base_url, 'selenium-nav', json.dumps(navigation_data, ensure_ascii=False))
+        return navigation_data
+    
     def _extract_dynamic_navigation_data(self, html_content: str) -> dict:
         """从动态加载的页面中提取真实的导航数据"""
         navigation_data = {}
@@ -768,14 +1693,14 @@ class DeepWikiToDocsifyConverter:
                 if router_data:
                     logger.info(f"🎯 获取到JavaScript路由数据: {type(router_data)}")
                     if isinstance(router_data, list):
-                        # 处理导航链接数据
+                        # 处理导航链接数据；嵌套菜单中常有重复的 href，解析结果已按 href 缓存
                         for item in router_data:
                             if isinstance(item, dict) and 'href' in item and 'text' in item:
                                 href = item['href']
                                 text = item['text']
                                 # 提取文件名
-                                filename = self._extract_filename_from_href(href)
-                                if filename:
+                                filename = _extract_filename_from_href(href)
+                                if filename and navigation_data.get(text) != filename:
                                     navigation_data[text] = filename
                                     logger.info(f"🔗 动态导航: {text} -> {filename}")
                     elif isinstance(router_data, dict):
@@ -788,23 +1713,14 @@ class DeepWikiToDocsifyConverter:
             
             # 2. 直接检查当前页面的所有链接
             try:
-                links = self.driver.find_elements(By.CSS_SELECTOR, "a[href]")
-                logger.info(f"🔍 分析页面中的 {len(links)} 个链接...")
+                # 序号文件名的筛选在浏览器中完成
+                links = self.driver.execute_script(_COLLECT_NAV_LINKS_JS) or []
+                logger.info(f"🔍 页面中有 {len(links)} 个序号链接...")
                 
-                for link in links:
-                    try:
-                        href = link.get_attribute('href')
-                        text = link.text.strip()
-                        
-                        if href and text and len(text) > 2:
-                            # 检查链接是否包含序号文件名模式
-                            filename = self._extract_filename_from_href(href)
-                            if filename and re.match(r'^[0-9]+(\.[0-9]+)?-[a-zA-Z]', filename):
-                                navigation_data[text] = filename
-                                logger.info(f"🎯 找到序号链接: {text} -> {filename}")
-                                
-                    except Exception as e:
-                        logger.debug(f"处理链接失败: {e}")
+                for text, filename in links:
+                    if len(text) > 2:
+                        navigation_data[text] = filename
+                        logger.info(f"🎯 找到序号链接: {text} -> {filename}")
                         
             except Exception as e:
                 logger.debug(f"链接分析失败: {e}")
@@ -819,20 +1735,23 @@ class DeepWikiToDocsifyConverter:
                     try:
                         if btn.is_displayed() and btn.is_enabled():
                             logger.debug("🔄 尝试展开导航菜单...")
+                            prev_count = self.driver.execute_script(_COUNT_LINKS_JS)
                             btn.click()
-                            time.sleep(2)
+                            
+                            # 新链接出现后立即继续，最多等待 2 秒
+                            try:
+                                WebDriverWait(self.driver, 2, poll_frequency=0.1).until(
+                                    lambda driver: driver.execute_script(_COUNT_LINKS_JS) > prev_count
+                                )
+                            except TimeoutException:
+                                logger.debug("展开后未出现新链接")
                             
                             # 重新检查链接
-                            new_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href]")
-                            for link in new_links:
-                                href = link.get_attribute('href')
-                                text = link.text.strip()
-                                
-                                if href and text and text not in navigation_data:
-                                    filename = self._extract_filename_from_href(href)
-                                    if filename and re.match(r'^[0-9]+(\.[0-9]+)?-[a-zA-Z]', filename):
-                                        navigation_data[text] = filename
-                                        logger.info(f"🆕 展开后发现: {text} -> {filename}")
+                            new_links = self.driver.execute_script(_COLLECT_NAV_LINKS_JS) or []
+                            for text, filename in new_links:
+                                if text not in navigation_data:
+                                    navigation_data[text] = filename
+                                    logger.info(f"🆕 展开后发现: {text} -> {filename}")
                                         
                     except Exception as e:
                         logger.debug(f"展开操作失败: {e}")
@@ -846,60 +1765,28 @@ class DeepWikiToDocsifyConverter:
         logger.info(f"🎯 动态提取到 {len(navigation_data)} 个真实文件名映射")
         return navigation_data
     
-    def _extract_filename_from_href(self, href: str) -> str:
-        """从href中提取文件名"""
-        if not href:
-            return None
-            
-        try:
-            # 移除查询参数和锚点
-            href = href.split('?')[0].split('#')[0]
-            
-            # 获取路径的最后一段
-            path_segments = href.strip('/').split('/')
-            if path_segments:
-                filename = path_segments[-1]
-                
-                # 检查是否是有效的序号文件名
-                if re.match(r'^[0-9]+(\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*$', filename):
-                    return filename
-                    
-                # 也检查倒数第二段
-                if len(path_segments) >= 2:
-                    filename = path_segments[-2]
-                    if re.match(r'^[0-9]+(\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*$', filename):
-                        return filename
-                        
-        except Exception as e:
-            logger.debug(f"提取文件名失败: {e}")
-        
-        return None
-    
-    def _extract_navigation_links(self, html_content: str) -> dict:
-        """从页面导航栏提取真正的文件名链接"""
+    def _extract_navigation_links(self, html_content: str, soup: BeautifulSoup = None) -> dict:
+        """从页面导航栏提取真正的文件名链接（可传入已解析的 soup 避免重复解析）"""
         title_to_filename = {}
         
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if soup is None:
+                soup = self._parse_html(html_content)
             
             # 查找所有导航链接
             # DeepWiki 的导航链接通常在左侧侧边栏
-            nav_links = soup.find_all('a', href=True)
+            nav_anchors = soup.find_all('a', href=True)
+            # 每个链接的 href 和文本只计算一次，两轮检查共用
+            nav_links = [(link.get('href', ''), _anchor_text(link)) for link in nav_anchors]
             
             logger.debug(f"🔍 分析 {len(nav_links)} 个链接...")
             
             # 调试：输出前几个链接的详细信息
-            for i, link in enumerate(nav_links[:10]):  # 只看前10个
-                href = link.get('href', '')
-                title = link.get_text(strip=True)
+            for i, ((href, title), link) in enumerate(zip(nav_links[:10], nav_anchors)):  # 只看前10个
                 classes = link.get('class', [])
                 logger.debug(f"🔗 链接 {i+1}: href='{href}', title='{title}', classes={classes}")
             
-            for link in nav_links:
-                href = link.get('href', '')
-                title = link.get_text(strip=True)
-                
+            for href, title in nav_links:
                 # 更灵活的链接检查
                 # 检查是否包含序号文件名模式
                 if href and title:
@@ -909,7 +1796,7 @@ class DeepWikiToDocsifyConverter:
                         filename = path_segments[-1]
                         
                         # 检查是否是有效的序号文件名
-                        if re.match(r'^[0-9]+(\.[0-9]+)?-[a-zA-Z][a-zA-Z0-9-]*$', filename):
+                        if _FILENAME_RE.match(filename):
                             title_to_filename[title] = filename
                             logger.info(f"🔗 找到导航链接: {title} -> {filename}")
                         else:
@@ -919,15 +1806,12 @@ class DeepWikiToDocsifyConverter:
             if not title_to_filename:
                 # 如果没找到任何序号链接，尝试更宽松的搜索
                 logger.debug("🔍 尝试宽松搜索...")
-                for link in nav_links:
-                    href = link.get('href', '')
-                    title = link.get_text(strip=True)
-                    
+                for href, title in nav_links:
                     # 检查任何包含连字符的路径段
                     if href and title and '-' in href:
                         path_segments = href.strip('/').split('/')
                         for segment in path_segments:
-                            if re.match(r'^[0-9]+.*-[a-zA-Z]', segment):
+                            if _LOOSE_FILENAME_RE.match(segment):
                                 title_to_filename[title] = segment
                                 logger.info(f"🔗 宽松匹配导航链接: {title} -> {segment}")
                                 break
@@ -942,84 +1826,54 @@ class DeepWikiToDocsifyConverter:
     def _extract_original_filename(self, content: str) -> str:
         """从内容中提取原始文件名"""
         try:
-            # 首先进行广泛搜索，看看内容中有什么数字-连字符模式
-            broad_search = re.findall(r'\b[0-9]+[-\.][a-zA-Z][a-zA-Z0-9-]*\b', content)
-            if broad_search:
-                logger.debug(f"🔍 广泛搜索找到的模式: {broad_search[:10]}")  # 只显示前10个
+            # 首先进行广泛搜索，看看内容中有什么数字-连字符模式（找到一个即可，调试时才收集全部）
+            has_broad_match = _BROAD_FILENAME_RE.search(content) is not None
+            if has_broad_match:
+                if logger.isEnabledFor(logging.DEBUG):
+                    broad_search = _BROAD_FILENAME_RE.findall(content)
+                    logger.debug(f"🔍 广泛搜索找到的模式: {broad_search[:10]}")  # 只显示前10个
+            else:
+                lowered_content = content.lower()
+                if not any(key in lowered_content for key in _ROUTE_KEYS):
+                    # 没有数字-连字符模式也没有路由字段，后续所有模式都不可能匹配
+                    return None
             
             # 1. 首先搜索标准的序号文件名模式（如 "1-overview", "4.1-backend-api-reference"）
-            standard_patterns = [
-                # 匹配 "1-overview", "2-getting-started" 等模式
-                r'"([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)"',
-                r"'([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)'",
-                # 匹配 "1.1-system-architecture", "4.1-backend-api-reference" 等模式
-                r'"([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)"',
-                r"'([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)'",
-                # 匹配路径中的文件名
-                r'\/([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)(?:\/|"|\?|$)',
-                r'\/([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)(?:\/|"|\?|$)',
-                # 不用引号包围的模式
-                r'\b([0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)\b',
-                r'\b([0-9]{1,2}\.[0-9]{1,2}-[a-zA-Z][a-zA-Z0-9-]*)\b',
-            ]
-            
-            # 收集所有匹配的标准文件名
-            found_standard_names = []
-            for pattern in standard_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    if len(match) >= 5:  # 至少像 "1-abc" 这样的长度
-                        found_standard_names.append(match)
-                        logger.debug(f"🎯 找到标准序号文件名: {match}")
-            
-            # 如果找到标准格式的文件名，返回最合适的
-            if found_standard_names:
+            # 一次扫描收集所有模式的候选，按模式优先级（从具体到宽泛）取第一个有候选的模式
+            found_by_priority = {}
+            for match in _STANDARD_FILENAME_RE.finditer(content):
+                name = match[match.lastindex]
+                if len(name) >= 5:  # 至少像 "1-abc" 这样的长度
+                    found_by_priority.setdefault(match.lastindex, []).append(name)
+            
+            if found_by_priority:
+                found_standard_names = found_by_priority[min(found_by_priority)]
+                logger.debug(f"🎯 找到标准序号文件名: {found_standard_names[:10]}")
                 # 按长度和复杂度排序，选择最合理的
                 best_name = min(found_standard_names, key=lambda x: (len(x), x))
                 logger.debug(f"✅ 选择最佳标准文件名: {best_name}")
                 return best_name
             
-            # 2. 如果没找到标准格式，搜索可能的路由或slug信息
-            route_patterns = [
-                # 在Next.js路由数据中搜索
-                r'"pathname":\s*"[^"]*\/([^"\/]+)"',
-                r'"href":\s*"[^"]*\/([^"\/]+)"',
-                r'"slug":\s*"([^"]+)"',
-                # 在React组件props中搜索
-                r'"params":\s*{[^}]*"slug":\s*"([^"]*)"',
-                r'"query":\s*{[^}]*"slug":\s*"([^"]*)"',
-                # 在页面元数据中搜索
-                r'"page":\s*{[^}]*"slug":\s*"([^"]*)"',
-                r'"route":\s*"[^"]*\/([^"\/]+)"',
-            ]
+            # 2. 特别搜索可能被编码的文件名（优先于路由候选；编码的文件名必然也能被广泛搜索找到）
+            if has_broad_match:
+                for pattern in _ENCODED_FILENAME_RES:
+                    matches = pattern.findall(content)
+                    for match in matches:
+                        if len(match) >= 5:
+                            logger.debug(f"🔓 找到编码的文件名: {match}")
+                            return match
             
+            # 3. 如果还没找到，搜索可能的路由或slug信息
             route_candidates = []
-            for pattern in route_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            for pattern in _ROUTE_FILENAME_RES:
+                matches = pattern.findall(content)
                 for match in matches:
                     if match and len(match) > 2 and not match.isdigit():
                         # 检查是否可能是文件名
-                        if re.match(r'^[a-zA-Z0-9][a-zA-Z0-9-_.]*$', match):
+                        if _ROUTE_CANDIDATE_RE.match(match):
                             route_candidates.append(match)
                             logger.debug(f"📝 发现路由候选: {match}")
             
-            # 3. 特别搜索可能被编码的文件名
-            encoded_patterns = [
-                # 搜索被HTML编码的内容
-                r'&quot;([0-9]{1,2}[-\.][a-zA-Z][a-zA-Z0-9-]*)&quot;',
-                # 搜索被转义的JSON字符串
-                r'\\"([0-9]{1,2}[-\.][a-zA-Z][a-zA-Z0-9-]*)\\"',
-                # 搜索URL编码的内容
-                r'%22([0-9]{1,2}[-\.][a-zA-Z][a-zA-Z0-9-]*)%22',
-            ]
-            
-            for pattern in encoded_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    if len(match) >= 5:
-                        logger.debug(f"🔓 找到编码的文件名: {match}")
-                        return match
-            
             # 4. 如果还是没找到，返回最佳的路由候选
             if route_candidates:
                 # 优先选择包含连字符的（更可能是文件名）
@@ -1040,64 +1894,28 @@ class DeepWikiToDocsifyConverter:
     
     def _sort_pages_by_order(self, pages: list) -> list:
         """按照序号和标题对页面进行排序"""
-        def get_sort_key(page):
-            slug = page.get('slug', '')
-            title = page.get('title', '')
-            
-            # 尝试从 slug 中提取序号
-            slug_match = re.match(r'^(\d+)', slug)
-            if slug_match:
-                return (int(slug_match.group(1)), slug)
-            
-            # 尝试从标题中提取序号
-            title_match = re.match(r'^(\d+)', title)
-            if title_match:
-                return (int(title_match.group(1)), title)
-            
-            # 使用 order 属性（如果有的话）
-            order = page.get('order', 9999)
-            if order != 9999:
-                return (order, title)
-            
-            # 默认按标题排序，但放在最后
-            return (9999, title)
-        
-        return sorted(pages, key=get_sort_key)
+        return sorted(pages, key=_page_sort_key)
     
     def _clean_merged_content(self, content: str) -> str:
-        """清理合并后的内容"""
-        # 移除重复的标题
-        lines = content.split('\n')
-        cleaned_lines = []
+        """清理合并后的内容：单次遍历，移除重复的标题和明显的数据行"""
+        final_lines = []
         seen_title = None
+        in_code_block = False
         
-        for line in lines:
+        for line in content.split('\n'):
             line_stripped = line.strip()
             
-            # 如果是标题行
+            # 如果是标题行（重复标题无论是否在代码块中都跳过）
             if line_stripped.startswith('# ') and not line_stripped.startswith('# #'):
                 title = line_stripped.lstrip('#').strip()
                 if seen_title is None:
                     seen_title = title
-                    cleaned_lines.append(line)
                 elif title == seen_title:
                     # 跳过重复的标题
                     continue
-                else:
-                    # 新的标题，可能是子章节
-                    cleaned_lines.append(line)
-            else:
-                cleaned_lines.append(line)
-        
-        # 移除明显的数据行
-        final_lines = []
-        in_code_block = False
-        
-        for line in cleaned_lines:
-            line_stripped = line.strip()
             
             # 处理代码块
-            if line_stripped.startswith('```'):
+            elif line_stripped.startswith('```'):
                 in_code_block = not in_code_block
                 final_lines.append(line)
                 continue
@@ -1107,11 +1925,11 @@ class DeepWikiToDocsifyConverter:
                 final_lines.append(line)
                 continue
             
-            # 跳过明显的数据行，但保留其他内容
-            if (line_stripped.startswith('{"') or 
-                line_stripped.startswith('["') or
-                ('"ID":' in line_stripped and '"' in line_stripped) or
-                (line_stripped.count('"') > 6 and ':' in line_stripped)):
+            # 跳过明显的数据行，但保留其他内容；先做廉价的包含检查，再统计引号
+            if line_stripped.startswith(_DATA_LINE_PREFIXES) or (
+                    '"' in line_stripped and (
+                        '"ID":' in line_stripped or
+                        (':' in line_stripped and line_stripped.count('"') > 6))):
                 continue
             
             final_lines.append(line)
@@ -1127,47 +1945,44 @@ class DeepWikiToDocsifyConverter:
             return original_filename
         
         # 如果没有映射的文件名，检查标题是否以序号开头
-        title_with_number = re.match(r'^(\d+)[\.\s-]*(.+)', title)
+        title_with_number = _TITLE_NUM_RE.match(title)
         if title_with_number:
             number = title_with_number.group(1)
             clean_title = title_with_number.group(2)
             # 生成带序号的 slug
-            slug = re.sub(r'[^\w\s-]', '', clean_title.lower())
-            slug = re.sub(r'[\s_-]+', '-', slug)
+            slug = _SLUG_STRIP_RE.sub('', clean_title.lower())
+            slug = _SLUG_DASH_RE.sub('-', slug)
             slug = slug.strip('-')
             final_slug = f"{number}-{slug}" if slug else number
             logger.debug(f"🔢 从标题提取序号: {title} -> {final_slug}")
             return final_slug
         
         # 默认处理：转换为小写，替换空格和特殊字符
-        slug = re.sub(r'[^\w\s-]', '', title.lower())
-        slug = re.sub(r'[\s_-]+', '-', slug)
+        slug = _SLUG_STRIP_RE.sub('', title.lower())
+        slug = _SLUG_DASH_RE.sub('-', slug)
         final_slug = slug.strip('-')
         logger.debug(f"📝 生成标准slug: {title} -> {final_slug}")
         return final_slug
     
-    def _extract_page_info(self, html_content: str, url: str) -> dict:
-        """从页面提取信息"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def _parse_html(self, html_content: str) -> BeautifulSoup:
+        """解析页面 HTML，供各提取方法共用（只构建提取时用到的标签）"""
+        return BeautifulSoup(html_content, 'lxml', parse_only=_PAGE_STRAINER)
+    
+    def _extract_page_info(self, html_content: str, url: str, soup: BeautifulSoup = None) -> dict:
+        """从页面提取信息（可传入已解析的 soup 避免重复解析）"""
+        if soup is None:
+            soup = self._parse_html(html_content)
         
         # 提取页面标题
         title = "DeepWiki 文档"
         
-        # 尝试多种方式获取标题
-        title_candidates = [
-            soup.find('title'),
-            soup.find('h1'),
-            soup.find('h2'),
-            soup.select_one('[data-testid="page-title"]'),
-            soup.select_one('.page-title'),
-            soup.select_one('.title')
-        ]
-        
-        for candidate in title_candidates:
-            if candidate and candidate.get_text().strip():
-                title = candidate.get_text().strip()
+        # 尝试多种方式获取标题，按顺序逐个查找，找到即停止
+        for method, query in _TITLE_CANDIDATE_QUERIES:
+            candidate = getattr(soup, method)(query)
+            candidate_text = candidate.get_text().strip() if candidate else ''
+            if candidate_text:
                 # 清理标题
-                title = re.sub(r'\s+', ' ', title)
+                title = _WS_RE.sub(' ', candidate_text)
                 title = title.replace(' | DeepWiki', '')
                 break
         
@@ -1192,66 +2007,33 @@ class DeepWikiToDocsifyConverter:
     
     def _extract_github_info(self, html_content: str, project_name: str) -> dict:
         """从页面中提取 GitHub 仓库和 commit 信息"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
         github_repo = ""
         commit_sha = ""
         
-        # 查找 GitHub 链接的多种方式
-        github_patterns = [
-            # 直接查找 GitHub 链接
-            r'https://github\.com/([^/]+/[^/\s"\'<>]+)',
-            # 从脚本中查找
-            r'github\.com/([^/]+/[^/\s"\'<>]+)',
-            # 从源码链接中查找
-            r'source.*?github\.com/([^/]+/[^/\s"\'<>]+)',
-        ]
-        
-        # 在页面文本中搜索仓库
-        for pattern in github_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                for match in matches:
-                    # 清理匹配结果
-                    repo = match.strip().rstrip('/')
-                    if '/' in repo and not repo.endswith('.git'):
-                        github_repo = f"https://github.com/{repo}"
-                        logger.info(f"🔗 发现 GitHub 仓库: {github_repo}")
-                        break
-                if github_repo:
+        # 在页面文本中搜索仓库（逐个匹配，找到可用的仓库即停止扫描）
+        for pattern in _GITHUB_REPO_RES:
+            for match in pattern.finditer(html_content):
+                # 清理匹配结果，去掉克隆地址的 .git 后缀
+                repo = match.group(1).strip().rstrip('/').removesuffix('.git')
+                if '/' in repo:
+                    github_repo = f"https://github.com/{repo}"
+                    logger.info(f"🔗 发现 GitHub 仓库: {github_repo}")
                     break
+            if github_repo:
+                break
         
         # 如果没有找到，尝试从 project_name 构造
         if not github_repo and project_name and '/' in project_name:
             github_repo = f"https://github.com/{project_name}"
             logger.info(f"📝 推测 GitHub 仓库: {github_repo}")
         
-        # 查找 commit SHA
-        commit_patterns = [
-            # 查找 commit hash 模式（7-40字符的十六进制）
-            r'commit[/_:\s]+([a-f0-9]{7,40})',
-            r'sha[/_:\s]+([a-f0-9]{7,40})',
-            r'revision[/_:\s]+([a-f0-9]{7,40})',
-            # 查找 blob 链接中的 commit
-            r'github\.com/[^/]+/[^/]+/blob/([a-f0-9]{7,40})',
-            # 在脚本数据中查找
-            r'"commit"[^"]*"([a-f0-9]{7,40})"',
-            r'"sha"[^"]*"([a-f0-9]{7,40})"',
-            # 在 meta 标签中查找
-            r'<meta[^>]*content="[^"]*([a-f0-9]{7,40})[^"]*"',
-        ]
-        
-        for pattern in commit_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                # 过滤出合法的 commit SHA（至少7位，最多40位）
-                for match in matches:
-                    if 7 <= len(match) <= 40:
-                        commit_sha = match[:8]  # 使用前8位
-                        logger.info(f"🎯 发现 commit SHA: {commit_sha}")
-                        break
-                if commit_sha:
-                    break
+        # 查找 commit SHA（模式本身限定了 7-40 位，第一个匹配即为结果）
+        for pattern in _COMMIT_SHA_RES:
+            match = pattern.search(html_content)
+            if match:
+                commit_sha = match.group(1)[:8]  # 使用前8位
+                logger.info(f"🎯 发现 commit SHA: {commit_sha}")
+                break
         
         if not commit_sha:
             logger.warning("⚠️ 未找到 commit SHA，将使用 main 分支")
@@ -1268,6 +2050,8 @@ class DeepWikiToDocsifyConverter:
     def convert(self) -> dict:
         """执行转换"""
         logger.info(f"🚀 开始转换 DeepWiki 站点: {self.base_url}")
+        # 本次转换生成的所有文件共用同一个生成时间
+        self._generated_at = time.strftime('%Y-%m-%d %H:%M:%S')
         
         try:
             # 获取主页内容
@@ -1275,18 +2059,22 @@ class DeepWikiToDocsifyConverter:
             if not html_content:
                 raise Exception("无法获取页面内容")
             
+            # 只解析一次 HTML，供页面信息和导航链接提取共用
+            soup = self._parse_html(html_content)
+            
             # 提取基本页面信息
-            main_page_info = self._extract_page_info(html_content, self.base_url)
+            main_page_info = self._extract_page_info(html_content, self.base_url, soup)
             
             # 如果使用Selenium，尝试提取动态导航数据
             dynamic_navigation = {}
             if self.use_selenium and self.driver:
                 logger.info("🎯 提取动态导航数据...")
-                dynamic_navigation = self._extract_dynamic_navigation_data(html_content)
+                dynamic_navigation = self._get_dynamic_navigation(html_content)
             
             # 从导航栏提取真实的文件名映射
             logger.info("🔗 分析导航栏链接...")
-            navigation_links = self._extract_navigation_links(html_content)
+            navigation_links = self._extract_navigation_links(html_content, soup)
+            del soup  # 解析树不再需要，在提取页面内容前释放
             
             # 合并动态和静态导航数据
             if dynamic_navigation:
@@ -1335,9 +2123,10 @@ class DeepWikiToDocsifyConverter:
                 'error': str(e)
             }
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("🛑 Selenium WebDriver 已关闭")
+            # WebDriver 在进程内共享，由 atexit 统一关闭
+            self._close_playwright()
+            if self.cache:
+                self.cache.close()
     
     def _create_page_files(self, pages: list, main_page_info: dict):
         """创建页面文件"""
@@ -1348,26 +2137,38 @@ class DeepWikiToDocsifyConverter:
         # 保存路径信息供其他方法使用
         self.processed_path_parts = path_parts
         
+        # GitHub 源码链接前缀，所有页面共用
+        blob_prefix = _blob_prefix(main_page_info)
+        
+        # 待写入的 (文件路径, 内容)，收集完后并发写入
+        files_to_write = []
+        
         if self.multilingual:
+            # 处理 Sources 链接（各语言内容相同，每个页面只处理一次）
+            processed_contents = [self._process_sources_links(page['content'], blob_prefix) for page in pages]
+            
             # 多语言版本：为每种语言创建文件
             for lang_code in ['zh-cn', 'en']:
                 if path_parts and len(path_parts) >= 2:
                     base_dir = self.output_dir / lang_code / "pages" / path_parts[0] / path_parts[1]
+                    rel_prefix = f"{lang_code}/pages/{path_parts[0]}/{path_parts[1]}"
                 else:
                     base_dir = self.output_dir / lang_code / "pages"
+                    rel_prefix = f"{lang_code}/pages"
                 
                 base_dir.mkdir(parents=True, exist_ok=True)
                 
+                # 记录该语言下每个页面的侧边栏链接路径，侧边栏直接查找
+                lang_paths = self._lang_slug_to_file[lang_code] = {}
+                
                 # 创建每个页面文件
-                for page in pages:
+                for page, processed_content in zip(pages, processed_contents):
                     filename = f"{page['slug']}.md"
                     file_path = base_dir / filename
-                    
-                    # 处理 Sources 链接
-                    processed_content = self._process_sources_links(page['content'], main_page_info.get('github_info', {}))
+                    lang_paths[page['slug']] = f"{rel_prefix}/{filename}"
                     
                     # 写入页面内容
-                    file_path.write_text(processed_content, encoding='utf-8')
+                    files_to_write.append((file_path, processed_content))
                     logger.info(f"📄 创建页面: {page['title']} -> {file_path.relative_to(self.output_dir)}")
         else:
             # 单语言版本
@@ -1380,29 +2181,32 @@ class DeepWikiToDocsifyConverter:
             base_dir.mkdir(parents=True, exist_ok=True)
             
             # 创建每个页面文件
-            created_files = {}  # 用于跟踪已创建的文件名
+            created_files = set()  # 用于跟踪已创建的文件名
+            next_suffix = {}  # 每个基础 slug 下一个待尝试的序号，避免每次从 1 开始重新探测
             for page in pages:
                 base_slug = page['slug']
                 slug = base_slug
-                counter = 1
                 
                 # 确保文件名唯一性
-                while slug in created_files:
-                    slug = f"{base_slug}-{counter}"
-                    counter += 1
+                if slug in created_files:
+                    counter = next_suffix.get(base_slug, 1)
+                    while slug in created_files:
+                        slug = f"{base_slug}-{counter}"
+                        counter += 1
+                    next_suffix[base_slug] = counter
                 
                 filename = f"{slug}.md"
                 file_path = base_dir / filename
-                created_files[slug] = True
+                created_files.add(slug)
                 
                 # 更新页面的 slug（用于侧边栏生成）
                 page['slug'] = slug
             
                 # 处理 Sources 链接
-                processed_content = self._process_sources_links(page['content'], main_page_info.get('github_info', {}))
+                processed_content = self._process_sources_links(page['content'], blob_prefix)
                 
                 # 写入页面内容
-                file_path.write_text(processed_content, encoding='utf-8')
+                files_to_write.append((file_path, processed_content))
                 
                 # 记录处理的页面
                 relative_path = str(file_path.relative_to(self.output_dir))
@@ -1413,6 +2217,57 @@ class DeepWikiToDocsifyConverter:
                 })
                 
                 logger.info(f"📄 创建页面: {page['title']} -> {relative_path}")
+        
+        # 建立 slug 到文件路径的索引（同一 slug 以第一次记录为准），供侧边栏和 README 查找
+        self._slug_to_file = {}
+        for processed_page in self.processed_pages:
+            self._slug_to_file.setdefault(processed_page['slug'], processed_page['file'])
+        
+        self._write_files(files_to_write)
+    
+    def _write(self, path: Path, text: str):
+        """以 UTF-8 字节一次性写入文本文件（不做换行符转换），必要时创建父目录"""
+        self._write_bytes(path, text.encode('utf-8'))
+    
+    def _write_bytes(self, path: Path, data: bytes):
+        """写入二进制内容；目标文件内容完全相同时跳过写入，重复运行时避免无谓的磁盘写入"""
+        try:
+            if path.read_bytes() == data:
+                return
+        except OSError:
+            # 文件不存在或无法读取，正常写入
+            path.parent.mkdir(parents=True, exist_ok=True)
+        # 内容已完整组装好，直接用文件描述符写入，省去文件对象和缓冲层的开销
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def _write_index_html(self, html_content: str):
+        """写入 index.html，并同时写入预压缩的 index.html.gz 供静态服务器直接使用"""
+        # index.html 引用的公共样式
+        self._write(self.output_dir / "assets" / "site.css", _SITE_CSS)
+        html_bytes = html_content.encode('utf-8')
+        self._write_bytes(self.output_dir / "index.html", html_bytes)
+        # mtime=0 让相同内容生成相同的压缩文件
+        self._write_bytes(self.output_dir / "index.html.gz", gzip.compress(html_bytes, compresslevel=9, mtime=0))
+    
+    def _write_files(self, files: list):
+        """并发写入多个文本文件，重叠磁盘 I/O 等待"""
+        # 同一路径多次写入时只保留最后一次的内容，与顺序写入的结果一致
+        files = list(dict(files).items())
+        if not files:
+            return
+        
+        def write(item):
+            self._write(*item)
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            # 迭代结果以便写入失败时抛出异常
+            list(executor.map(write, files))
     
     def _generate_docsify_files(self, main_page_info: dict, pages: list = None, navigation_structure: list = None):
         """生成 Docsify 配置文件"""
@@ -1432,222 +2287,39 @@ class DeepWikiToDocsifyConverter:
             self._generate_main_readme_with_pages(main_page_info, pages or [])
         
         # 生成 .nojekyll 文件
-        (self.output_dir / ".nojekyll").write_text("", encoding='utf-8')
+        self._write(self.output_dir / ".nojekyll", "")
     
     def _generate_multilingual_files(self, main_page_info: dict, pages: list, navigation_structure: list = None):
         """生成多语言版本的配置文件"""
-        project_name = main_page_info['project_name']
-        
-        # 1. 生成根目录的 index.html（多语言版本）
-        self._generate_multilingual_index_html(project_name)
-        
-        # 2. 生成根目录的侧边栏（语言选择）
-        self._generate_root_sidebar()
-        
-        # 3. 生成根目录的 README.md
-        self._generate_language_selection_readme(main_page_info)
-        
-        # 4. 生成中文版本
-        self._generate_language_version('zh-cn', main_page_info, pages, '中文', navigation_structure)
+        project_name = main_page_info['project_name']
         
-        # 5. 生成英文版本
-        self._generate_language_version('en', main_page_info, pages, 'English', navigation_structure)
+        # 以下各项写入不同的文件，互不依赖，并发生成以重叠磁盘 I/O
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                # 1. 生成根目录的 index.html（多语言版本）
+                executor.submit(self._generate_multilingual_index_html, project_name),
+                # 2. 生成根目录的侧边栏（语言选择）
+                executor.submit(self._generate_root_sidebar),
+                # 3. 生成根目录的 README.md
+                executor.submit(self._generate_language_selection_readme, main_page_info),
+                # 4. 生成中文版本
+                executor.submit(self._generate_language_version, 'zh-cn', main_page_info, pages, '中文', navigation_structure),
+                # 5. 生成英文版本
+                executor.submit(self._generate_language_version, 'en', main_page_info, pages, 'English', navigation_structure),
+            ]
+            # 取结果以便任何一项失败时抛出异常
+            for future in futures:
+                future.result()
         
         logger.info("🌐 多语言文件生成完成")
     
     def _generate_multilingual_index_html(self, site_name: str):
         """生成多语言版本的 index.html"""
-        html_content = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-  <meta charset="UTF-8">
-  <title>{site_name}</title>
-  <meta http-equiv="X-UA-Compatible" content="IE=edge,chrome=1" />
-  <meta name="description" content="从 DeepWiki 转换的文档站点">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=1.0">
-  <link rel="stylesheet" href="//unpkg.com/docsify@4/lib/themes/vue.css">
-  <style>
-    .sidebar {{
-      padding-top: 6px;
-    }}
-    .markdown-section {{
-      max-width: 800px;
-    }}
-    .app-name-link {{
-      color: var(--theme-color, #42b983) !important;
-    }}
-    /* 语言切换按钮样式 */
-    .language-switch {{
-      position: fixed;
-      top: 20px;
-      right: 20px;
-      z-index: 1000;
-      background: var(--theme-color, #42b983);
-      color: white;
-      border: none;
-      border-radius: 4px;
-      padding: 8px 12px;
-      cursor: pointer;
-      font-size: 14px;
-      text-decoration: none;
-      transition: background-color 0.3s;
-    }}
-    .language-switch:hover {{
-      background: var(--theme-color-dark, #369870);
-      color: white;
-    }}
-    .language-menu {{
-      position: fixed;
-      top: 60px;
-      right: 20px;
-      z-index: 1000;
-      background: white;
-      border: 1px solid #eee;
-      border-radius: 4px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-      display: none;
-      min-width: 120px;
-    }}
-    .language-menu a {{
-      display: block;
-      padding: 10px 15px;
-      color: #333;
-      text-decoration: none;
-      border-bottom: 1px solid #eee;
-    }}
-    .language-menu a:last-child {{
-      border-bottom: none;
-    }}
-    .language-menu a:hover {{
-      background: #f8f9fa;
-    }}
-    .language-menu.show {{
-      display: block;
-    }}
-  </style>
-</head>
-<body>
-  <div id="app">正在加载...</div>
-  
-  <!-- 语言切换菜单 -->
-  <button class="language-switch" onclick="toggleLanguageMenu()">
-    🌐 语言 / Language
-  </button>
-  <div class="language-menu" id="languageMenu">
-    <a href="#/zh-cn/">🇨🇳 中文</a>
-    <a href="#/en/">🇺🇸 English</a>
-  </div>
-
-  <script>
-    // 语言切换功能
-    function toggleLanguageMenu() {{
-      const menu = document.getElementById('languageMenu');
-      menu.classList.toggle('show');
-    }}
-    
-    // 点击页面其他地方关闭菜单
-    document.addEventListener('click', function(event) {{
-      const menu = document.getElementById('languageMenu');
-      const button = document.querySelector('.language-switch');
-      if (!menu.contains(event.target) && !button.contains(event.target)) {{
-        menu.classList.remove('show');
-      }}
-    }});
-
-    window.$docsify = {{
-      name: '{site_name}',
-      repo: '',
-      homepage: 'zh-cn/README.md',
-      loadSidebar: '_sidebar.md',
-      autoHeader: true,
-      subMaxLevel: 3,
-      maxLevel: 4,
-      alias: {{
-        '.*zh-cn.*/_sidebar.md': '/zh-cn/_sidebar.md',
-        '.*en.*/_sidebar.md': '/en/_sidebar.md',
-        '/zh-cn/README.md': '/zh-cn/README.md',
-        '/en/README.md': '/en/README.md',
-        '/zh-cn/pages/(.*)': '/zh-cn/pages/$1',
-        '/en/pages/(.*)': '/en/pages/$1'
-      }},
-      fallbackLanguages: ['zh-cn'],
-      nameLink: {{
-        '/zh-cn/': '#/zh-cn/',
-        '/en/': '#/en/',
-        '/': '#/'
-      }},
-      search: {{
-        maxAge: 86400000,
-        paths: 'auto',
-        placeholder: {{
-          '/zh-cn/': '搜索文档...',
-          '/en/': 'Search...',
-          '/': '搜索文档...'
-        }},
-        noData: {{
-          '/zh-cn/': '没有找到结果',
-          '/en/': 'No results found',
-          '/': '没有找到结果'
-        }},
-        depth: 6
-      }},
-      copyCode: {{
-        buttonText: {{
-          '/zh-cn/': '复制代码',
-          '/en/': 'Copy Code',
-          '/': '复制代码'
-        }},
-        errorText: {{
-          '/zh-cn/': '复制失败',
-          '/en/': 'Copy failed',
-          '/': '复制失败'
-        }},
-        successText: {{
-          '/zh-cn/': '已复制到剪贴板',
-          '/en/': 'Copied to clipboard',
-          '/': '已复制到剪贴板'
-        }}
-      }},
-      pagination: {{
-        previousText: {{
-          '/zh-cn/': '上一页',
-          '/en/': 'Previous',
-          '/': '上一页'
-        }},
-        nextText: {{
-          '/zh-cn/': '下一页',
-          '/en/': 'Next',
-          '/': '下一页'
-        }},
-        crossChapter: true,
-        crossChapterText: true
-      }},
-      mermaid: {{
-        theme: 'default'
-      }}
-    }}
-  </script>
-  <!-- Docsify v4 -->
-  <script src="//unpkg.com/docsify@4"></script>
-  <!-- Mermaid -->
-  <script src="//unpkg.com/mermaid@9/dist/mermaid.min.js"></script>
-  <script>
-    mermaid.initialize({{
-      theme: 'default',
-      startOnLoad: false
-    }});
-  </script>
-  <script src="//unpkg.com/docsify-mermaid@1/dist/docsify-mermaid.js"></script>
-  <!-- 插件 -->
-  <script src="//unpkg.com/docsify/lib/plugins/search.min.js"></script>
-  <script src="//unpkg.com/docsify/lib/plugins/zoom-image.min.js"></script>
-  <script src="//unpkg.com/docsify-copy-code@2"></script>
-  <script src="//unpkg.com/docsify-pagination@2/dist/docsify-pagination.min.js"></script>
-</body>
-</html>'''
+        html_content = _MULTILINGUAL_INDEX_TPL.substitute(site_name=site_name)
         
-        index_file = self.output_dir / "index.html"
-        index_file.write_text(html_content, encoding='utf-8')
+        # 语言切换菜单的脚本
+        self._write(self.output_dir / "assets" / "lang-switch.js", _LANG_SWITCH_JS)
+        self._write_index_html(html_content)
         logger.info("🌐 生成多语言 index.html...")
     
     def _generate_root_sidebar(self):
@@ -1659,16 +2331,11 @@ class DeepWikiToDocsifyConverter:
 '''
         
         sidebar_file = self.output_dir / "_sidebar.md"
-        sidebar_file.write_text(sidebar_content, encoding='utf-8')
+        self._write(sidebar_file, sidebar_content)
         logger.info("📋 生成根目录侧边栏...")
     
     def _generate_language_selection_readme(self, main_page_info: dict):
         """生成语言选择页面"""
-        github_repo_link = ""
-        if main_page_info.get('github_info', {}).get('repo_url'):
-            github_repo_link = f"""
-- **源码仓库 / Source Repository**: [{main_page_info['github_info']['repo_url']}]({main_page_info['github_info']['repo_url']})"""
-
         readme_content = f'''# {main_page_info['project_name']}
 
 > 🌐 多语言文档站点 / Multilingual Documentation Site
@@ -1692,8 +2359,8 @@ class DeepWikiToDocsifyConverter:
 ## 项目信息 / Project Information
 
 - **项目名称 / Project Name**: {main_page_info['project_name']}
-- **原始页面 / Original Page**: [{main_page_info['url']}]({main_page_info['url']}){github_repo_link}
-- **生成时间 / Generated**: {time.strftime('%Y-%m-%d %H:%M:%S')}
+- **原始页面 / Original Page**: [{main_page_info['url']}]({main_page_info['url']}){_repo_link_line(main_page_info, 'root')}
+- **生成时间 / Generated**: {self._generated_at}
 
 ## 技术支持 / Technical Support
 
@@ -1705,7 +2372,7 @@ class DeepWikiToDocsifyConverter:
 '''
         
         readme_file = self.output_dir / "README.md"
-        readme_file.write_text(readme_content, encoding='utf-8')
+        self._write(readme_file, readme_content)
         logger.info("📄 生成语言选择页面...")
     
     def _generate_language_version(self, lang_code: str, main_page_info: dict, pages: list, lang_name: str, navigation_structure: list = None):
@@ -1728,242 +2395,63 @@ class DeepWikiToDocsifyConverter:
             sidebar_content = "<!-- English Documentation Navigation -->\n\n* [Home](en/README.md)\n\n"
         
         if pages:
-            # 动态生成页面路径（根据实际创建的目录结构）
-            # 从第一个页面的处理信息中获取路径结构
-            path_parts = []
-            if hasattr(self, 'processed_path_parts'):
-                path_parts = self.processed_path_parts
-            
-            # 构建路径前缀
-            if path_parts and len(path_parts) >= 2:
-                path_prefix = f"{lang_code}/pages/{path_parts[0]}/{path_parts[1]}"
-            else:
-                path_prefix = f"{lang_code}/pages"
-            
-            # 简单按字母顺序列出所有页面
-            # 使用专门的多语言层级化组织方法
-            organized_pages = self._organize_pages_hierarchically_for_multilingual(pages, path_prefix)
+            # 按文件名序号进行层级排序和分组，页面路径使用创建页面文件时记录的各语言路径，
+            # 没有对应文件的页面被跳过（与单语言模式一致）
+            lang_paths = self._lang_slug_to_file.get(lang_code, {})
+            organized_pages = self._organize_pages_hierarchically(
+                pages, lambda page: lang_paths.get(page['slug'])
+            )
             sidebar_content += self._generate_hierarchical_sidebar_content_for_multilingual(organized_pages)
         
         sidebar_file = lang_dir / "_sidebar.md"
-        sidebar_file.write_text(sidebar_content, encoding='utf-8')
-    
-    def _organize_pages_hierarchically_for_multilingual(self, pages: list, path_prefix: str) -> dict:
-        """为多语言模式按照文件名序号组织页面层级结构"""
-        organized = {}
-        
-        for page in pages:
-            title = page['title']
-            slug = page['slug']
-            relative_path = f"{path_prefix}/{slug}.md"
-            
-            # 解析文件名序号
-            sequence_info = self._parse_filename_sequence(slug)
-            if sequence_info:
-                major = sequence_info['major']
-                minor = sequence_info.get('minor')
-                
-                # 确保主要分组存在
-                if major not in organized:
-                    organized[major] = {
-                        'main_page': None,
-                        'sub_pages': {},
-                        'order': major
-                    }
-                
-                if minor is None:
-                    # 主页面（如 1-overview, 2-getting-started）
-                    organized[major]['main_page'] = {
-                        'title': title,
-                        'path': relative_path,
-                        'slug': slug,
-                        'order': major
-                    }
-                else:
-                    # 子页面（如 1.1-system-architecture, 2.1-installation）
-                    organized[major]['sub_pages'][minor] = {
-                        'title': title,
-                        'path': relative_path,
-                        'slug': slug,
-                        'order': minor
-                    }
-            else:
-                # 没有序号的页面放在最后
-                if 999 not in organized:
-                    organized[999] = {
-                        'main_page': None,
-                        'sub_pages': {},
-                        'order': 999
-                    }
-                
-                # 使用一个递增的序号放在子页面中
-                next_order = len(organized[999]['sub_pages']) + 1
-                organized[999]['sub_pages'][next_order] = {
-                    'title': title,
-                    'path': relative_path,
-                    'slug': slug,
-                    'order': next_order
-                }
-        
-        return organized
+        self._write(sidebar_file, sidebar_content)
     
     def _generate_hierarchical_sidebar_content_for_multilingual(self, organized_pages: dict) -> str:
         """为多语言模式生成层级化的侧边栏内容"""
-        content = ""
+        parts = []
         
-        # 按主要序号排序
-        for major in sorted(organized_pages.keys()):
+        # 按主要序号排序，最后一个分组只需确定一次
+        sorted_majors = sorted(organized_pages)
+        last_major = sorted_majors[-1] if sorted_majors else None
+        for major in sorted_majors:
             group = organized_pages[major]
+            sub_keys = sorted(group['sub_pages'])
             
             # 如果是最后的未分类组，添加标题
             if major == 999:
-                content += "* 📋 其他页面\n"
+                parts.append("* 📋 其他页面\n")
             
-            # 添加主页面
+            # 分组标题：主页面链接；没有主页面但有子页面时用分组占位标题（未分类组已有标题）
             if group['main_page']:
                 main_page = group['main_page']
-                content += f"* [{main_page['title']}]({main_page['path']})\n"
-                
-                # 添加该组的子页面
-                if group['sub_pages']:
-                    for minor in sorted(group['sub_pages'].keys()):
-                        sub_page = group['sub_pages'][minor]
-                        content += f"  * [{sub_page['title']}]({sub_page['path']})\n"
-            else:
-                # 如果没有主页面，但有子页面，直接列出子页面
-                if group['sub_pages']:
-                    if major != 999:  # 对于有序号但没有主页面的情况
-                        content += f"* 📁 第 {major} 部分\n"
-                    
-                    for minor in sorted(group['sub_pages'].keys()):
-                        sub_page = group['sub_pages'][minor]
-                        indent = "  " if major != 999 else "  "
-                        content += f"{indent}* [{sub_page['title']}]({sub_page['path']})\n"
-            
-            # 在每个主要分组后添加空行（除了最后一个）
-            if major != max(organized_pages.keys()):
-                content += "\n"
-        
-        return content
-    
-    def _generate_hierarchical_sidebar(self, pages: list, navigation: list, path_prefix: str, lang_code: str) -> str:
-        """生成层级化的侧边栏"""
-        sidebar_content = ""
-        
-        # 创建页面映射
-        page_map = {page['title']: page for page in pages}
-        
-        # 按导航结构的顺序和层级生成侧边栏
-        nav_sorted = sorted(navigation, key=lambda x: (x.get('order', 0), x.get('level', 0)))
-        
-        for nav_item in nav_sorted:
-            title = nav_item['title']
-            level = nav_item.get('level', 0)
+                parts.append(f"* [{main_page['title']}]({main_page['path']})\n")
+            elif sub_keys and major != 999:
+                parts.append(f"* 📁 第 {major} 部分\n")
             
-            if title in page_map:
-                page = page_map[title]
-                relative_path = f"{path_prefix}/{page['slug']}.md"
-                
-                # 根据层级添加适当的缩进
-                if level == 0:
-                    sidebar_content += f"* [{title}]({relative_path})\n"
-                else:
-                    indent = "  " * (level + 1)
-                    sidebar_content += f"{indent}* [{title}]({relative_path})\n"
-        
-        # 添加未在导航中的页面
-        if navigation:
-            nav_titles = {nav['title'] for nav in navigation}
-            unmapped_pages = [page for page in pages if page['title'] not in nav_titles]
+            # 添加该组的子页面（各种情况下缩进相同）
+            for minor in sub_keys:
+                sub_page = group['sub_pages'][minor]
+                parts.append(f"  * [{sub_page['title']}]({sub_page['path']})\n")
             
-            if unmapped_pages:
-                other_label = "* 其他页面\n" if lang_code == 'zh-cn' else "* Other Pages\n"
-                sidebar_content += other_label
-                for page in sorted(unmapped_pages, key=lambda p: p['title']):
-                    relative_path = f"{path_prefix}/{page['slug']}.md"
-                    sidebar_content += f"  * [{page['title']}]({relative_path})\n"
+            # 在每个主要分组后添加空行（除了最后一个）
+            if major != last_major:
+                parts.append("\n")
         
-        return sidebar_content
+        return "".join(parts)
     
     def _generate_language_readme(self, lang_dir: Path, main_page_info: dict, pages: list, lang_code: str, lang_name: str):
         """生成特定语言的 README.md"""
         
-        # 构建源码仓库链接
-        github_repo_link = ""
-        if main_page_info.get('github_info', {}).get('repo_url'):
-            repo_url = main_page_info['github_info']['repo_url']
-            if lang_code == 'zh-cn':
-                github_repo_link = f"\n- **源码仓库**: [{repo_url}]({repo_url})"
-            else:
-                github_repo_link = f"\n- **Source Repository**: [{repo_url}]({repo_url})"
-        
-        if lang_code == 'zh-cn':
-            readme_content = f'''# {main_page_info['project_name']}
-
-> 🚀 从 DeepWiki 转换的文档站点
-
-## 📖 文档导航
-
-本文档包含 **{len(pages)}** 个页面，涵盖了项目的完整技术文档。
-
-### 文档页面
-
-请查看左侧导航栏浏览所有页面，或使用搜索功能快速找到所需内容。
-
-## 🔗 快速链接
-
-- **原始页面**: [{main_page_info['url']}]({main_page_info['url']}){github_repo_link}
-
-## 📝 使用说明
-
-此文档站点支持：
-
-- 📱 响应式设计，支持移动端
-- 🔍 全文搜索功能
-- 🖼️ 图片缩放查看
-- 📋 代码一键复制
-- 📄 分页导航
-- 🌐 中英文切换
-
----
-
-*生成时间: {time.strftime('%Y-%m-%d %H:%M:%S')}*
-'''
-        else:  # en
-            readme_content = f'''# {main_page_info['project_name']}
-
-> 🚀 Documentation Site Converted from DeepWiki
-
-## 📖 Documentation Navigation
-
-This documentation contains **{len(pages)}** pages covering the complete technical documentation of the project.
-
-### Documentation Pages
-
-Please browse all pages using the sidebar navigation or use the search function to quickly find the content you need.
-
-## 🔗 Quick Links
-
-- **Original Page**: [{main_page_info['url']}]({main_page_info['url']}){github_repo_link}
-
-## 📝 Features
-
-This documentation site supports:
-
-- 📱 Responsive design for mobile devices
-- 🔍 Full-text search functionality
-- 🖼️ Image zoom viewing
-- 📋 One-click code copying
-- 📄 Page navigation
-- 🌐 Chinese/English switching
-
----
-
-*Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}*
-'''
+        readme_content = _LANGUAGE_README_TPL[lang_code].substitute(
+            project_name=main_page_info['project_name'],
+            page_count=len(pages),
+            url=main_page_info['url'],
+            repo_link=_repo_link_line(main_page_info, lang_code),
+            generated_at=self._generated_at
+        )
         
         readme_file = lang_dir / "README.md"
-        readme_file.write_text(readme_content, encoding='utf-8')
+        self._write(readme_file, readme_content)
     
     def _generate_sidebar_with_pages(self, pages: list, navigation_structure: list = None):
         """生成包含所有页面的层级化侧边栏"""
@@ -1972,37 +2460,33 @@ This documentation site supports:
         
         if pages:
             # 按文件名序号进行层级排序和分组
-            organized_pages = self._organize_pages_hierarchically(pages)
+            organized_pages = self._organize_pages_hierarchically(pages, self._processed_page_path)
             sidebar_content += self._generate_hierarchical_sidebar_content(organized_pages)
         
         sidebar_file = self.output_dir / "_sidebar.md"
-        sidebar_file.write_text(sidebar_content, encoding='utf-8')
+        self._write(sidebar_file, sidebar_content)
         logger.info("� 生成层级化侧边栏...")
     
-    def _organize_pages_hierarchically(self, pages: list) -> dict:
-        """按照文件名序号组织页面层级结构"""
+    def _processed_page_path(self, page: dict) -> str:
+        """返回页面实际写入的相对路径，没有处理记录时返回 None"""
+        return self._slug_to_file.get(page['slug'])
+    
+    def _organize_pages_hierarchically(self, pages: list, path_resolver) -> dict:
+        """按照文件名序号组织页面层级结构（path_resolver(page) 返回页面链接路径，返回空值的页面被跳过）"""
         organized = {}
         
         for page in pages:
-            # 找到这个页面对应的处理记录
-            processed_page = None
-            for p in self.processed_pages:
-                if p['slug'] == page['slug']:
-                    processed_page = p
-                    break
-            
-            if not processed_page:
+            relative_path = path_resolver(page)
+            if not relative_path:
                 continue
             
-            relative_path = processed_page['file']
             title = page['title']
             slug = page['slug']
             
             # 解析文件名序号
-            sequence_info = self._parse_filename_sequence(slug)
+            sequence_info = _parse_filename_sequence(slug)
             if sequence_info:
-                major = sequence_info['major']
-                minor = sequence_info.get('minor')
+                major, minor = sequence_info
                 
                 # 确保主要分组存在
                 if major not in organized:
@@ -2048,60 +2532,38 @@ This documentation site supports:
         
         return organized
     
-    def _parse_filename_sequence(self, filename: str) -> dict:
-        """解析文件名中的序号信息"""
-        # 匹配 "1-overview", "1.1-system-architecture" 等格式
-        pattern = r'^(\d+)(?:\.(\d+))?-'
-        match = re.match(pattern, filename)
-        
-        if match:
-            major = int(match.group(1))
-            minor = int(match.group(2)) if match.group(2) else None
-            return {
-                'major': major,
-                'minor': minor
-            }
-        
-        return None
-    
     def _generate_hierarchical_sidebar_content(self, organized_pages: dict) -> str:
         """生成层级化的侧边栏内容"""
-        content = ""
+        parts = []
         
-        # 按主要序号排序
-        for major in sorted(organized_pages.keys()):
+        # 按主要序号排序，最后一个分组只需确定一次
+        sorted_majors = sorted(organized_pages)
+        last_major = sorted_majors[-1] if sorted_majors else None
+        for major in sorted_majors:
             group = organized_pages[major]
+            sub_keys = sorted(group['sub_pages'])
             
             # 如果是最后的未分类组，添加标题
             if major == 999:
-                content += "* 📋 其他页面\n"
+                parts.append("* 📋 其他页面\n")
             
-            # 添加主页面
+            # 分组标题：主页面链接；没有主页面但有子页面时用分组占位标题（未分类组已有标题）
             if group['main_page']:
                 main_page = group['main_page']
-                content += f"* [{main_page['title']}]({main_page['path']})\n"
-                
-                # 添加该组的子页面
-                if group['sub_pages']:
-                    for minor in sorted(group['sub_pages'].keys()):
-                        sub_page = group['sub_pages'][minor]
-                        content += f"  * [{sub_page['title']}]({sub_page['path']})\n"
-            else:
-                # 如果没有主页面，但有子页面，直接列出子页面
-                if group['sub_pages']:
-                    if major != 999:  # 对于有序号但没有主页面的情况
-                        content += f"* 📁 第 {major} 部分\n"
-                    
-                    for minor in sorted(group['sub_pages'].keys()):
-                        sub_page = group['sub_pages'][minor]
-                        indent = "  " if major != 999 else "  "
-                        content += f"{indent}* [{sub_page['title']}]({sub_page['path']})\n"
+                parts.append(f"* [{main_page['title']}]({main_page['path']})\n")
+            elif sub_keys and major != 999:
+                parts.append(f"* 📁 第 {major} 部分\n")
+            
+            # 添加该组的子页面（各种情况下缩进相同）
+            for minor in sub_keys:
+                sub_page = group['sub_pages'][minor]
+                parts.append(f"  * [{sub_page['title']}]({sub_page['path']})\n")
             
             # 在每个主要分组后添加空行（除了最后一个）
-            if major != max(organized_pages.keys()):
-                content += "\n"
+            if major != last_major:
+                parts.append("\n")
         
-        return content
+        return "".join(parts)
     
     def _generate_main_readme_with_pages(self, main_page_info: dict, pages: list):
         """生成包含页面导航的主 README.md"""
@@ -2120,12 +2582,7 @@ This documentation site supports:
             # 简单按字母顺序列出所有页面
             readme_content += "### 📚 所有页面\n\n"
             for page in sorted(pages, key=lambda p: p['title']):
-                relative_path = None
-                for processed_page in self.processed_pages:
-                    if processed_page['slug'] == page['slug']:
-                        relative_path = processed_page['file']
-                        break
-                
+                relative_path = self._slug_to_file.get(page['slug'])
                 if relative_path:
                     readme_content += f"- [{page['title']}]({relative_path})\n"
             readme_content += "\n"
@@ -2139,10 +2596,7 @@ This documentation site supports:
 - **DeepWiki 原始页面**: [{main_page_info['url']}]({main_page_info['url']})"""
         
         # 添加源码仓库链接
-        if main_page_info.get('github_info', {}).get('repo_url'):
-            repo_url = main_page_info['github_info']['repo_url']
-            readme_content += f"""
-- **源码仓库**: [{repo_url}]({repo_url})"""
+        readme_content += _repo_link_line(main_page_info, 'zh-cn')
         
         readme_content += f"""
 
@@ -2174,90 +2628,17 @@ npx docsify serve
 
 ---
 
-*由 [DeepWiki2Docsify](https://github.com/yourusername/deepwiki2docsify) 工具生成于 {time.strftime('%Y-%m-%d %H:%M:%S')}*
+*由 [DeepWiki2Docsify](https://github.com/yourusername/deepwiki2docsify) 工具生成于 {self._generated_at}*
 """
         
         readme_file = self.output_dir / "README.md"
-        readme_file.write_text(readme_content, encoding='utf-8')
+        self._write(readme_file, readme_content)
     
     def _generate_index_html(self, site_name: str = "DeepWiki 文档"):
         """生成 index.html"""
-        html_content = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-  <meta charset="UTF-8">
-  <title>{site_name}</title>
-  <meta http-equiv="X-UA-Compatible" content="IE=edge,chrome=1" />
-  <meta name="description" content="从 DeepWiki 转换的文档站点">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0, minimum-scale=1.0">
-  <link rel="stylesheet" href="//unpkg.com/docsify@4/lib/themes/vue.css">
-  <style>
-    .sidebar {{
-      padding-top: 6px;
-    }}
-    .markdown-section {{
-      max-width: 800px;
-    }}
-    .app-name-link {{
-      color: var(--theme-color, #42b983) !important;
-    }}
-  </style>
-</head>
-<body>
-  <div id="app">正在加载...</div>
-  <script>
-    window.$docsify = {{
-      name: '{site_name}',
-      repo: '',
-      homepage: 'README.md',
-      loadSidebar: true,
-      autoHeader: true,
-      subMaxLevel: 3,
-      maxLevel: 4,
-      search: {{
-        maxAge: 86400000,
-        paths: 'auto',
-        placeholder: '搜索文档...',
-        noData: '没有找到结果',
-        depth: 6
-      }},
-      copyCode: {{
-        buttonText: '复制代码',
-        errorText: '复制失败',
-        successText: '已复制到剪贴板'
-      }},
-      pagination: {{
-        previousText: '上一页',
-        nextText: '下一页',
-        crossChapter: true,
-        crossChapterText: true
-      }},
-      mermaid: {{
-        theme: 'default'
-      }}
-    }}
-  </script>
-  <!-- Docsify v4 -->
-  <script src="//unpkg.com/docsify@4"></script>
-  <!-- Mermaid -->
-  <script src="//unpkg.com/mermaid@9/dist/mermaid.min.js"></script>
-  <script>
-    mermaid.initialize({{
-      theme: 'default',
-      startOnLoad: false
-    }});
-  </script>
-  <script src="//unpkg.com/docsify-mermaid@1/dist/docsify-mermaid.js"></script>
-  <!-- 插件 -->
-  <script src="//unpkg.com/docsify/lib/plugins/search.min.js"></script>
-  <script src="//unpkg.com/docsify/lib/plugins/zoom-image.min.js"></script>
-  <script src="//unpkg.com/docsify-copy-code@2"></script>
-  <script src="//unpkg.com/docsify-pagination@2/dist/docsify-pagination.min.js"></script>
-</body>
-</html>'''
+        html_content = _INDEX_TPL.substitute(site_name=site_name)
         
-        index_file = self.output_dir / "index.html"
-        index_file.write_text(html_content, encoding='utf-8')
+        self._write_index_html(html_content)
         logger.info("🌐 生成 index.html...")
 
 
@@ -2267,7 +2648,8 @@ npx docsify serve
 @click.option('--use-selenium/--no-selenium', default=True, help='是否使用 Selenium 处理动态内容')
 @click.option('--multilingual', is_flag=True, help='生成多语言版本（中英文）')
 @click.option('--force', is_flag=True, help='强制覆盖非空的输出目录（谨慎使用）')
-def main(url: str, output: str, use_selenium: bool, multilingual: bool, force: bool):
+@click.option('--cache/--no-cache', default=True, help='缓存抓取的页面，重复运行时复用（保存在 ~/.cache/deepwiki2docsify/fetch_cache.sqlite）')
+def main(url: str, output: str, use_selenium: bool, multilingual: bool, force: bool, cache: bool):
     """
     DeepWiki 到 Docsify 转换器
     
@@ -2290,11 +2672,15 @@ def main(url: str, output: str, use_selenium: bool, multilingual: bool, force: b
         print("⚠️ 强制覆盖模式：将覆盖输出目录中的现有文件")
     
     if not SELENIUM_AVAILABLE and use_selenium:
-        print("⚠️  Selenium 未安装，将使用基础模式")
-        print("💡 安装 Selenium: pip install selenium webdriver-manager")
-        use_selenium = False
+        if PLAYWRIGHT_AVAILABLE:
+            print("ℹ️  Selenium 未安装，将使用 Playwright 处理动态内容")
+        else:
+            print("⚠️  Selenium 未安装，将使用基础模式")
+            print("💡 安装 Selenium: pip install selenium webdriver-manager")
+            print("💡 或安装 Playwright: pip install playwright && playwright install chromium")
+            use_selenium = False
     
-    converter = DeepWikiToDocsifyConverter(url, output, use_selenium, multilingual, force)
+    converter = DeepWikiToDocsifyConverter(url, output, use_selenium, multilingual, force, cache)
     result = converter.convert()
     
     if result['success']: